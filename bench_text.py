@@ -0,0 +1,74 @@
+# bench_text.py
+"""Measure per-frame cost of text drawing: arcade.draw_text vs cached TextGroup.
+
+Draws the BattleView legend and prompt (6 strings) in an offscreen window for a
+number of frames with each approach and prints the mean frame time as JSON.
+
+Usage:
+    python bench_text.py [frames]
+"""
+import json
+import sys
+import time
+
+import arcade
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, TextGroup
+
+# (name, text, x, y, color, size, extra kwargs) as drawn by BattleView.on_draw
+LINES = [
+    ("title", "Legend:", 20, SCREEN_HEIGHT - 40, arcade.color.BLACK, 16, {}),
+    ("hit", "Red = Hit", 20, SCREEN_HEIGHT - 58, arcade.color.RED, 14, {}),
+    ("miss", "Green = Miss", 20, SCREEN_HEIGHT - 76, arcade.color.GREEN, 14, {}),
+    ("sunk", "Purple = Ship Destroyed", 20, SCREEN_HEIGHT - 94, arcade.color.PURPLE, 14, {}),
+    ("stats", "Shots: 12  Hits: 5  Sunk: 1  Accuracy: 42%", 20, SCREEN_HEIGHT - 112, arcade.color.BLACK, 14, {}),
+    ("prompt", "Player 1 - Attack Opponent: Click any square to target it",
+     SCREEN_WIDTH / 2, 10, arcade.color.RED, 16, {"anchor_x": "center"}),
+]
+
+
+def run_frames(window, frames, draw):
+    """Return the mean wall time (ms) of `frames` frames that call `draw`."""
+    # Warm up font and glyph caches so both approaches start equal
+    for _ in range(10):
+        window.clear()
+        draw()
+    window.ctx.finish()
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        window.clear()
+        draw()
+        window.ctx.finish()
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    window = arcade.Window(SCREEN_WIDTH, SCREEN_HEIGHT, "Text benchmark", visible=False)
+
+    def immediate():
+        for _, text, x, y, color, size, kwargs in LINES:
+            arcade.draw_text(text, x, y, color, size, **kwargs)
+
+    texts = TextGroup()
+
+    def cached():
+        for name, text, x, y, color, size, kwargs in LINES:
+            texts.set(name, text, x, y, color, size, **kwargs)
+        texts.draw()
+
+    draw_text_ms = run_frames(window, frames, immediate)
+    text_group_ms = run_frames(window, frames, cached)
+    window.close()
+
+    print(json.dumps({
+        "frames": frames,
+        "strings_per_frame": len(LINES),
+        "draw_text_ms_per_frame": round(draw_text_ms, 4),
+        "text_group_ms_per_frame": round(text_group_ms, 4),
+        "speedup": round(draw_text_ms / text_group_ms, 2) if text_group_ms else None,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,10 @@
 import arcade, arcade.gui
-import socket
 from arcade import Rect
+from constants import TextGroup
+from discovery import Browser, get_local_ip
 
-# ------------- Utility for showing local IP -------------
-
-def get_local_ip():
-    """
-    Retrieves the local IP address of the machine.
-    Attempts to connect to an external server (Google DNS) to get the IP.
-    Falls back to hostname resolution if connection fails.
-    """
-    try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))  # Connect to external server
-        ip = s.getsockname()[0]    # Get socket's own IP address
-        s.close()
-        return ip
-    except:
-        # Fall back to hostname resolution
-        return socket.gethostbyname(socket.gethostname())
+# Most discovered games listed on the join screen
+MAX_LISTED_GAMES = 4
 
 
 # ------------- Main Menu (Host / Join Buttons) -------------
@@ -26,8 +12,9 @@ def get_local_ip():
 class ConnectView(arcade.View):
     """Main menu view with options to host or join a game."""
 
-    def __init__(self):
+    def __init__(self, game):
         super().__init__()
+        self.game = game  # InternetGame controller
 
         # UIManager to handle GUI widgets
         self.manager = arcade.gui.UIManager()
@@ -55,12 +42,12 @@ class ConnectView(arcade.View):
         @host_button.event("on_click")
         def on_click_host_button(event):
             # Switch to HostWaitingView when hosting game
-            self.window.show_view(HostWaitingView())
+            self.window.show_view(HostWaitingView(self.game))
 
         @join_button.event("on_click")
         def on_click_join_button(event):
             # Switch to JoinGameView when joining a game
-            self.window.show_view(JoinGameView())
+            self.window.show_view(JoinGameView(self.game))
 
     def on_hide_view(self):
         """Disable UIManager when view is hidden to suspend GUI processing."""
@@ -81,34 +68,54 @@ class ConnectView(arcade.View):
 
 class HostWaitingView(arcade.View):
     """Screen shown to the host player displaying their local IP to share."""
+    # Static screen: the window may drop to its idle frame rate while waiting for a client
+    idle_ok = True
 
-    def __init__(self):
+
+    def __init__(self, game):
         super().__init__()
+        self.game = game
         # Retrieve local IP address for display
         self.host_ip = get_local_ip()
-        # Notify game window to begin hosting connection with this IP
-        self.window.host_connect(self.host_ip)
+        # Notify the game to begin hosting connection with this IP
+        self.game.host_connect(self.host_ip)
         arcade.set_background_color(arcade.color.WHITE)
+        # Cached text objects drawn as one batch
+        self.texts = TextGroup()
 
     def on_draw(self):
         """Draw hosting info and instructions."""
         self.clear()
-        arcade.draw_text("Hosting Game…", 400, 450, arcade.color.BLACK, 30, anchor_x="center")
-        arcade.draw_text(f"Give this IP to your opponent:", 400, 350, arcade.color.BLACK, 20, anchor_x="center")
-        arcade.draw_text(self.host_ip, 400, 300, arcade.color.DARK_GRAY, 40, anchor_x="center")
+        self.texts.set("title", "Hosting Game…", 400, 450, arcade.color.BLACK, 30, anchor_x="center")
+        self.texts.set("hint", "Players on your network will see this game,", 400, 380, arcade.color.BLACK, 20, anchor_x="center")
+        self.texts.set("hint2", "or can join with this IP:", 400, 350, arcade.color.BLACK, 20, anchor_x="center")
+        self.texts.set("ip", self.host_ip, 400, 300, arcade.color.DARK_GRAY, 40, anchor_x="center")
+        self.texts.draw()
 
 
-# ----------- Join screen (type an IP address) -------------
+# ----------- Join screen (pick a LAN game or type an IP address) -------------
 
 class JoinGameView(arcade.View):
-    """Screen for joining a hosted game by entering host's IP address."""
+    """Screen for joining a hosted game.
+
+    Games announced on the LAN are listed as one-click buttons; typing the
+    host's IP address remains available as a fallback.
+    """
 
-    def __init__(self):
+    def __init__(self, game):
         super().__init__()
+        self.game = game
         # Create UIManager for managing input box and button
         self.manager = arcade.gui.UIManager()
         self.manager.enable()
 
+        # Live list of games announced on the LAN, shown as buttons
+        self.browser = Browser()
+        self.listed_games = None
+        self.games_box = arcade.gui.UIBoxLayout(vertical=True, space_between=10)
+        self.games_anchor = self.manager.add(arcade.gui.UIAnchorLayout())
+        self.games_anchor.add(child=self.games_box, anchor_x="center_x", anchor_y="top", align_y=-150)
+
         # Create an input text box for entering IP address
         self.input_box = arcade.gui.UIInputText(
             x=300,
@@ -129,35 +136,88 @@ class JoinGameView(arcade.View):
             height=40
         )
 
+        # Same address, but a dedicated match server (server.py) instead of a hosting player
+        self.server_button = arcade.gui.UIFlatButton(
+            text="Join Server",
+            x=335,
+            y=180,
+            width=150,
+            height=40
+        )
+
         # Add widgets to the UIManager so they are processed and drawn
         self.manager.add(self.input_box)
         self.manager.add(self.join_button)
+        self.manager.add(self.server_button)
 
         # Bind the connect button click to the on_connect handler
         self.join_button.on_click = self.on_connect
+        self.server_button.on_click = self.on_connect_server
+
+        # Cached text objects drawn as one batch
+        self.texts = TextGroup()
     
 
     def on_connect(self, event):
         """Callback when the connect button is pressed to join the game.
 
         Retrieves the IP address from input and calls the join_connect method
-        on the main window, initiating connection to the host.
+        on the game controller, initiating connection to the host.
         """
         ip = self.input_box.text.strip()
         print("Connecting to:", ip)
-        self.window.join_connect(ip)
+        self.game.join_connect(ip)
         self.clear()  # Clear screen after connect
 
+    def on_connect_server(self, event):
+        """Callback for the Join Server button: play through a match server at the typed address."""
+        ip = self.input_box.text.strip()
+        print("Connecting to match server:", ip)
+        self.game.join_server(ip)
+
+    def on_update(self, delta_time):
+        """Rebuild the game buttons whenever the discovered list changes."""
+        games = self.browser.games()[:MAX_LISTED_GAMES]
+        if games == self.listed_games:
+            return
+        self.listed_games = games
+        self.games_box.clear()
+        for name, ip, port in games:
+            button = arcade.gui.UIFlatButton(text=f"{name} ({ip})", width=360, height=40)
+            button.on_click = lambda event, ip=ip: self.join_discovered(ip)
+            self.games_box.add(button)
+
+    def join_discovered(self, ip):
+        """Join a game picked from the LAN list."""
+        print("Connecting to:", ip)
+        self.game.join_connect(ip)
+
+    def on_hide_view(self):
+        """Stop listening for announcements and suspend GUI processing."""
+        self.browser.close()
+        self.manager.disable()
+
 
     def on_draw(self):
         """Render the join screen UI and instructions."""
         self.clear()
         self.manager.draw()
-        arcade.draw_text(
-            "Enter Host IP:",
+        self.texts.set(
+            "games",
+            "Games on your network:" if self.listed_games else "Searching for games on your network...",
+            self.window.width // 2,
+            self.window.height - 120,
+            arcade.color.BLACK,
+            24,
+            anchor_x="center"
+        )
+        self.texts.set(
+            "prompt",
+            "Or enter Host IP:",
             self.window.width // 2,
             380,
             arcade.color.BLACK,
             30,
             anchor_x="center"
-        )
\ No newline at end of file
+        )
+        self.texts.draw()
\ No newline at end of file
@@ -1,34 +1,93 @@
 import arcade
 from pyglet.graphics import Batch
+from engine import Board, letters, placement_cells
 
 # Constants
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 800
 SCREEN_TITLE = "Battleship Setup" 
 SQUARE_SIZE = 50
-letters = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J']
-player1_board = {}
-player2_board = {}
-blank_board = {}
-for letter in letters:
-    for number in range(1, 11):
-        player1_board[letter+str(number)] = 0
-        player2_board[letter+str(number)] = 0
-        blank_board[letter+str(number)] = 0
+# Bitboard-backed boards; they still read like {"A1": state} dicts
+player1_board = Board()
+player2_board = Board()
+blank_board = Board()
+
+
+def coords_to_key(x, y):
+    """Convert the pixel center of a ship part on the centered grid to a board key (e.g. 'A1')."""
+    col = int((x - (SCREEN_WIDTH - SQUARE_SIZE * 10) / 2) // SQUARE_SIZE)
+    row = int((y - (SCREEN_HEIGHT - SQUARE_SIZE * 10) / 2) // SQUARE_SIZE)
+    col = max(0, min(9, col))  # Bound columns to 0-9
+    row = max(0, min(9, row))  # Bound rows to 0-9
+    return letters[row] + str(col + 1)
+
+
+class ShipSpriteFactory:
+    """Hands out pooled ship-part sprites that share two preloaded textures.
+
+    The End/Middle images are read from disk once and added to the window's
+    default texture atlas once, so building a fleet never touches the disk or
+    uploads textures again. Sprites returned with ``release`` are reused by the
+    next ``acquire``.
+    """
+
+    def __init__(self):
+        self.end_texture = None
+        self.middle_texture = None
+        self.pool = []
+
+    def load(self):
+        """Load both textures and add them to the shared atlas (only the first call does work)."""
+        if self.end_texture is not None:
+            return
+        self.end_texture = arcade.load_texture('Pictures/End.png')
+        self.middle_texture = arcade.load_texture('Pictures/Middle.png')
+        window = arcade.get_window()
+        if window is not None:
+            atlas = window.ctx.default_atlas
+            atlas.add(self.end_texture)
+            atlas.add(self.middle_texture)
+
+    def acquire(self, end, angle):
+        """Return a ship-part sprite, reusing a pooled one when available.
+
+        Args:
+            end (bool): True for a bow/stern part, False for a middle part.
+            angle (float): Initial rotation in degrees.
+        """
+        self.load()
+        texture = self.end_texture if end else self.middle_texture
+        if self.pool:
+            sprite = self.pool.pop()
+            sprite.texture = texture
+        else:
+            sprite = arcade.Sprite(texture)
+        sprite.angle = angle
+        sprite.width = SQUARE_SIZE
+        sprite.height = 30
+        sprite.hit = 0
+        return sprite
+
+    def release(self, sprites):
+        """Detach sprites from their sprite lists and return them to the pool."""
+        for sprite in list(sprites):
+            sprite.remove_from_sprite_lists()
+            self.pool.append(sprite)
+
+
+# Shared by every view so textures and pooled sprites survive view changes
+ship_sprites = ShipSpriteFactory()
 
 
 def createShip(number_of_parts, start_x, start_y, horizontal=True):
     sprites_list = arcade.SpriteList()
     for i in range(number_of_parts):
         if i == 0:
-            sprite = arcade.Sprite('Pictures/End.png', angle=0 if horizontal else 90)
+            sprite = ship_sprites.acquire(True, 0 if horizontal else 90)
         elif i == number_of_parts - 1:
-            sprite = arcade.Sprite('Pictures/End.png', angle=180 if horizontal else 90)
+            sprite = ship_sprites.acquire(True, 180 if horizontal else 90)
         else:
-            sprite = arcade.Sprite('Pictures/Middle.png', angle=0 if horizontal else 90)
-
-        sprite.width = SQUARE_SIZE
-        sprite.height = 30 
+            sprite = ship_sprites.acquire(False, 0 if horizontal else 90)
 
         if horizontal:
             sprite.center_x = start_x + i * SQUARE_SIZE + SQUARE_SIZE / 2
@@ -40,49 +99,151 @@ def createShip(number_of_parts, start_x, start_y, horizontal=True):
         sprites_list.append(sprite)
     return sprites_list
 
+def part_angle(index, length, horizontal):
+    """Sprite angle for part `index` of a snapped ship (matches SetupView's snapping)."""
+    if horizontal:
+        return 180 if index == length - 1 and index > 0 else 0
+    return 270 if index == 0 else 90
+
+
+def createFleet(fleet, grid_x_offset, grid_y_offset):
+    """Build ship sprites for a fleet of Placement tuples on the grid at the given offsets."""
+    sprites_list = arcade.SpriteList()
+    for placement in fleet:
+        cells = placement_cells(placement)
+        for i, cell in enumerate(cells):
+            end = i == 0 or i == len(cells) - 1
+            sprite = ship_sprites.acquire(end, part_angle(i, len(cells), placement.horizontal))
+            row, col = divmod(cell, 10)
+            sprite.center_x = grid_x_offset + col * SQUARE_SIZE + SQUARE_SIZE / 2
+            sprite.center_y = grid_y_offset + row * SQUARE_SIZE + SQUARE_SIZE / 2
+            sprites_list.append(sprite)
+    return sprites_list
+
+
+class TextGroup:
+    """Cached arcade.Text objects drawn together through one pyglet Batch.
+
+    Views call ``set`` every frame with the text they want on screen; the
+    arcade.Text is built on first use and only re-laid-out when its content
+    actually changes, instead of arcade.draw_text building a new layout per call.
+    """
+
+    def __init__(self):
+        self.batch = Batch()
+        self.texts = {}
+
+    def set(self, name, text, x, y, color, font_size=12, **kwargs):
+        """Create or update the text stored under `name` and return it."""
+        label = self.texts.get(name)
+        if label is None:
+            label = arcade.Text(text, x, y, color, font_size, batch=self.batch, **kwargs)
+            self.texts[name] = label
+        elif label.text != text:
+            label.text = text
+        return label
+
+    def draw(self):
+        self.batch.draw()
+
+
+# Fill color for each cell state (empty and intact ship cells both look blank)
+CELL_COLORS = {
+    0: arcade.color.WHITE,
+    1: arcade.color.WHITE,
+    2: arcade.color.RED,
+    3: arcade.color.GREEN,
+    4: arcade.color.PURPLE,
+}
+
+
+class GridRenderer:
+    """Retained-mode renderer for the 10x10 grid and its labels.
+
+    The cells live in one SpriteList on top of a black backing square (which
+    shows through as the grid lines) and the labels are prebuilt arcade.Text
+    objects in one Batch, so a frame costs two draw calls. Cell colors are only
+    touched when the board's hit/miss/sunk masks change.
+    """
+
+    def __init__(self, grid_x_offset, grid_y_offset):
+        self.sprites = arcade.SpriteList()
+        grid_size = SQUARE_SIZE * 10
+        self.sprites.append(arcade.SpriteSolidColor(
+            grid_size + 2, grid_size + 2,
+            center_x=grid_x_offset + grid_size / 2,
+            center_y=grid_y_offset + grid_size / 2,
+            color=arcade.color.BLACK,
+        ))
+
+        # One sprite per cell, indexed like the engine's bits (row * 10 + col)
+        self.cells = []
+        for row in range(10):
+            for col in range(10):
+                cell = arcade.SpriteSolidColor(
+                    SQUARE_SIZE - 2, SQUARE_SIZE - 2,
+                    center_x=grid_x_offset + col * SQUARE_SIZE + SQUARE_SIZE / 2,
+                    center_y=grid_y_offset + row * SQUARE_SIZE + SQUARE_SIZE / 2,
+                    color=CELL_COLORS[0],
+                )
+                self.cells.append(cell)
+                self.sprites.append(cell)
+
+        self.batch = Batch()
+        self.labels = []
+        for i in range(10):
+            self.labels.append(arcade.Text(
+                letters[i],
+                grid_x_offset + SQUARE_SIZE * i + SQUARE_SIZE / 2,
+                grid_y_offset - 20,
+                arcade.color.BLACK,
+                12,
+                anchor_x="center",
+                batch=self.batch,
+            ))
+            self.labels.append(arcade.Text(
+                str(i + 1),
+                grid_x_offset - 20,
+                grid_y_offset + SQUARE_SIZE * i + SQUARE_SIZE / 2,
+                arcade.color.BLACK,
+                12,
+                anchor_y="center",
+                batch=self.batch,
+            ))
+
+        # (hits, misses, sunk) masks the cell colors currently reflect
+        self._masks = (0, 0, 0)
+
+    def sync(self, board):
+        """Recolor only the cells whose state changed since the last sync."""
+        masks = (board.hits_mask, board.misses_mask, board.sunk_mask)
+        if masks == self._masks:
+            return
+
+        changed = 0
+        for old, new in zip(self._masks, masks):
+            changed |= old ^ new
+        while changed:
+            low_bit = changed & -changed
+            index = low_bit.bit_length() - 1
+            self.cells[index].color = CELL_COLORS[board.state_at(index)]
+            changed ^= low_bit
+        self._masks = masks
+
+    def draw(self):
+        self.sprites.draw()
+        self.batch.draw()
+
+
 def on_draw(current_view, player_board):
-    grid_x_offset = current_view.grid_x_offset
-    grid_y_offset = current_view.grid_y_offset
-
-    # Choose which board to draw based on current_view.player
-    board = player_board
-
-    # Draw grid squares
-    for key, value in board.items():
-        row = ord(key[0]) - ord('A')
-        col = int(key[1:]) - 1
-        state = value
-
-        left = grid_x_offset + col * SQUARE_SIZE
-        bottom = grid_y_offset + row * SQUARE_SIZE
-
-        if state == 0 or state == 1:
-            color = arcade.color.WHITE
-        elif state == 2:
-            color = arcade.color.RED
-        elif state == 3:
-            color = arcade.color.GREEN
-        elif state == 4:
-            color = arcade.color.PURPLE
-        arcade.draw_lrbt_rectangle_outline(left, left + SQUARE_SIZE, bottom, bottom+SQUARE_SIZE, arcade.color.BLACK, 2)
-        arcade.draw_lrbt_rectangle_filled(left, left + SQUARE_SIZE, bottom, bottom + SQUARE_SIZE, color)
-    # Draw labels
-    for i in range(10):
-        arcade.draw_text(
-            letters[i],
-            grid_x_offset + SQUARE_SIZE * i + SQUARE_SIZE / 2,
-            grid_y_offset - 20,
-            arcade.color.BLACK,
-            12,
-            anchor_x="center"
-        )
-        arcade.draw_text(
-            str(i + 1),
-            grid_x_offset - 20,
-            grid_y_offset + SQUARE_SIZE * i + SQUARE_SIZE / 2,
-            arcade.color.BLACK,
-            12,
-            anchor_y="center"
-        )
+    # Each view keeps its own retained grid, built on first draw
+    renderer = getattr(current_view, 'grid_renderer', None)
+    if renderer is None:
+        renderer = GridRenderer(current_view.grid_x_offset, current_view.grid_y_offset)
+        current_view.grid_renderer = renderer
+
+    # Choose which board to draw; switching boards only recolors the cells that differ
+    renderer.sync(player_board)
+    renderer.draw()
 
     current_view.all_sprites.draw()
@@ -0,0 +1,147 @@
+"""LAN game discovery over UDP broadcast.
+
+A hosting game runs an Announcer that broadcasts a small JSON datagram on
+DISCOVERY_PORT every ANNOUNCE_INTERVAL seconds. Joiners run a Browser that
+listens on that port and keeps the games it has heard from recently;
+``Browser.games()`` drops any host not heard from for GAME_TTL seconds, so
+the list stays live without any explicit "game closed" message.
+
+Both run on the shared asyncio network loop (see transport.py) and never
+touch the internet: the host's address is taken from the datagram itself.
+"""
+import asyncio
+import json
+import socket
+import threading
+import time
+
+import transport
+
+DISCOVERY_PORT = 5556
+ANNOUNCE_INTERVAL = 1.0  # Seconds between announcements
+GAME_TTL = 3.5           # Seconds after the last announcement before a game disappears
+SERVICE = "battleship"
+DISCOVERY_VERSION = 1
+
+
+def get_local_ip():
+    """Return this machine's LAN IPv4 address without needing an internet route.
+
+    Connecting a UDP socket sends nothing; it only asks the OS which local
+    address would be used to reach a private-range address. Falls back to the
+    addresses the hostname resolves to, then to loopback.
+    """
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(("10.255.255.255", 1))
+            ip = s.getsockname()[0]
+            if not ip.startswith("127.") and ip != "0.0.0.0":
+                return ip
+    except OSError:
+        pass
+    try:
+        for info in socket.getaddrinfo(socket.gethostname(), None, socket.AF_INET):
+            ip = info[4][0]
+            if not ip.startswith("127."):
+                return ip
+    except OSError:
+        pass
+    return "127.0.0.1"
+
+
+def _announcement(name, port):
+    return json.dumps({"service": SERVICE, "version": DISCOVERY_VERSION,
+                       "name": name, "port": port}).encode("utf-8")
+
+
+class _DatagramHandler(asyncio.DatagramProtocol):
+    def __init__(self, on_datagram):
+        self.on_datagram = on_datagram
+
+    def datagram_received(self, data, address):
+        self.on_datagram(data, address)
+
+
+class Announcer:
+    """Broadcasts an open game on the LAN until closed.
+
+    Args:
+        port (int): TCP port the host is listening on.
+        name (str): Name shown in joiners' game lists (defaults to the hostname).
+    """
+
+    def __init__(self, port, name=None, discovery_port=DISCOVERY_PORT, net=None):
+        self.net = net or transport.get_network_loop()
+        self.message = _announcement(name or socket.gethostname(), port)
+        self.discovery_port = discovery_port
+        self.future = self.net.submit(self._announce_loop())
+
+    async def _announce_loop(self):
+        loop = asyncio.get_running_loop()
+        udp, _ = await loop.create_datagram_endpoint(
+            asyncio.DatagramProtocol, family=socket.AF_INET, allow_broadcast=True)
+        try:
+            while True:
+                udp.sendto(self.message, ("255.255.255.255", self.discovery_port))
+                await asyncio.sleep(ANNOUNCE_INTERVAL)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            udp.close()
+
+    def close(self):
+        """Stop announcing; safe to call from any thread."""
+        self.future.cancel()
+
+
+class Browser:
+    """Listens for announcements and keeps a live list of open games on the LAN."""
+
+    def __init__(self, discovery_port=DISCOVERY_PORT, net=None):
+        self.net = net or transport.get_network_loop()
+        self.discovery_port = discovery_port
+        self._games = {}  # (ip, port) -> (name, last_seen)
+        self._lock = threading.Lock()
+        self.error = None
+        self.future = self.net.submit(self._listen())
+
+    async def _listen(self):
+        loop = asyncio.get_running_loop()
+        try:
+            udp, _ = await loop.create_datagram_endpoint(
+                lambda: _DatagramHandler(self._on_datagram), local_addr=("0.0.0.0", self.discovery_port),
+                family=socket.AF_INET, reuse_port=hasattr(socket, "SO_REUSEPORT"))
+        except OSError as e:
+            self.error = e
+            print(f"LAN discovery unavailable: {e}")
+            return
+        try:
+            await asyncio.Event().wait()  # Receive until cancelled
+        except asyncio.CancelledError:
+            pass
+        finally:
+            udp.close()
+
+    def _on_datagram(self, data, address):
+        try:
+            info = json.loads(data)
+            if info.get("service") != SERVICE:
+                return
+            key = (address[0], int(info["port"]))
+            name = str(info.get("name") or address[0])
+        except (ValueError, KeyError, TypeError):
+            return  # Not one of ours
+        with self._lock:
+            self._games[key] = (name, time.monotonic())
+
+    def games(self):
+        """Return open games as a sorted list of (name, ip, port), dropping expired ones."""
+        cutoff = time.monotonic() - GAME_TTL
+        with self._lock:
+            for key in [key for key, (_, seen) in self._games.items() if seen < cutoff]:
+                del self._games[key]
+            return sorted((name, ip, port) for (ip, port), (name, _) in self._games.items())
+
+    def close(self):
+        """Stop listening; safe to call from any thread."""
+        self.future.cancel()
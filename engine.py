@@ -0,0 +1,400 @@
+"""Headless Battleship rules engine.
+
+Holds the attack, hit, sink and game-over rules shared by every game mode.
+Nothing in here imports arcade or knows about pixels, so whole matches can be
+simulated, tested and benchmarked without opening a window.
+"""
+import random
+from collections import namedtuple
+
+letters = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J']
+GRID_SIZE = 10
+CELL_COUNT = GRID_SIZE * GRID_SIZE
+BOARD_KEYS = [letter + str(number) for letter in letters for number in range(1, GRID_SIZE + 1)]
+# Board key -> bit index (row * 10 + col), so 'A1' is bit 0 and 'J10' is bit 99
+KEY_INDEX = {key: index for index, key in enumerate(BOARD_KEYS)}
+
+# Cell states, shared with the renderer and the network layer
+EMPTY = 0
+SHIP = 1
+HIT = 2
+MISS = 3
+SUNK = 4
+ATTACKED_STATES = (HIT, MISS, SUNK)
+
+# Ship lengths of the standard fleet (carrier, battleship, submarine, cruiser, destroyer)
+FLEET_LENGTHS = (5, 4, 3, 3, 2)
+
+# One ship of a fleet: origin cell index (its first part, row * 10 + col), whether it
+# extends along the row (horizontal) or up the column, and its length. A fleet is a
+# list of these in ship order; it is the canonical form used by setup, the network
+# protocol and stored setup data.
+Placement = namedtuple('Placement', ['cell', 'horizontal', 'length'])
+
+# Outcome of a single shot.
+#   result: 'miss', 'hit', 'sunk', 'already' or 'invalid'
+#   ship/part: index of the ship and part that was hit, or None
+#   sunk_keys: every cell of the ship when result is 'sunk', else empty
+ShotResult = namedtuple('ShotResult', ['result', 'key', 'ship', 'part', 'sunk_keys'])
+
+
+def placement_cells(placement):
+    """Return the cell indices covered by `placement`, in part order.
+
+    Raises:
+        ValueError: If the ship would leave the grid.
+    """
+    cell, horizontal, length = placement
+    row, col = divmod(cell, GRID_SIZE)
+    if not 0 <= cell < CELL_COUNT or length < 1 or (col if horizontal else row) + length > GRID_SIZE:
+        raise ValueError(f"Placement {tuple(placement)} does not fit on the grid")
+    step = 1 if horizontal else GRID_SIZE
+    return [cell + i * step for i in range(length)]
+
+
+def placement_keys(placement):
+    """Return the board keys covered by `placement`, in part order."""
+    return [BOARD_KEYS[index] for index in placement_cells(placement)]
+
+
+def random_fleet(rng=random, lengths=FLEET_LENGTHS):
+    """Return a legal fleet of non-overlapping ships placed uniformly at random.
+
+    Args:
+        rng (random.Random): Source of randomness; pass a seeded one for repeatable fleets.
+        lengths (tuple): Ship lengths to place.
+    """
+    while True:
+        fleet = []
+        occupied = 0
+        for length in lengths:
+            for _ in range(100):
+                horizontal = rng.random() < 0.5
+                row = rng.randrange(GRID_SIZE if horizontal else GRID_SIZE - length + 1)
+                col = rng.randrange(GRID_SIZE - length + 1 if horizontal else GRID_SIZE)
+                placement = Placement(row * GRID_SIZE + col, horizontal, length)
+                mask = 0
+                for index in placement_cells(placement):
+                    mask |= 1 << index
+                if not occupied & mask:
+                    occupied |= mask
+                    fleet.append(placement)
+                    break
+            else:
+                break  # Boxed in: start the whole fleet again
+        if len(fleet) == len(lengths):
+            return fleet
+
+
+def encode_fleet(fleet):
+    """Pack a fleet into two bytes per ship: origin cell, then orientation bit | length."""
+    data = bytearray()
+    for cell, horizontal, length in fleet:
+        data.append(cell)
+        data.append((0x80 if horizontal else 0) | length)
+    return bytes(data)
+
+
+def decode_fleet(data):
+    """Inverse of encode_fleet.
+
+    Raises:
+        ValueError: If the bytes do not describe ships that fit on the grid.
+    """
+    if len(data) % 2:
+        raise ValueError("Fleet encoding must be two bytes per ship")
+    fleet = []
+    for i in range(0, len(data), 2):
+        placement = Placement(data[i], bool(data[i + 1] & 0x80), data[i + 1] & 0x7F)
+        placement_cells(placement)
+        fleet.append(placement)
+    return fleet
+
+
+class Board:
+    """A single player's 10x10 grid and the fleet placed on it.
+
+    Cells are stored as four 100-bit integer masks (bit ``row * 10 + col``):
+    ships, hits, misses and sunk cells. Hit tests, "already attacked" checks and
+    the game-over check are single bit operations.
+
+    The board still reads like the old ``{"A1": state}`` dicts (``board[key]``,
+    ``get``, ``items``, ``in``), so views and the network layer can use it
+    without knowing about the masks.
+    """
+
+    def __init__(self, cells=None):
+        self.ships_mask = 0
+        self.hits_mask = 0    # Hit ship cells, sunk ones included
+        self.misses_mask = 0
+        self.sunk_mask = 0
+        # The fleet as placed, and each ship as a list of board keys in part order plus its cell mask
+        self.fleet = []
+        self.ships = []
+        self.ship_masks = []
+        # Cell index -> (ship, part) lookup and hits left per ship, built by place_fleet
+        self.cell_parts = [None] * CELL_COUNT
+        self.ship_remaining = []
+        # Live counters, updated as shots resolve so nothing needs a board scan
+        self.ship_cells_left = 0  # Intact ship cells; zero means the fleet is gone
+        self.shots = 0            # Shots received, i.e. the opponent's shots fired
+        self.hits = 0
+        self.misses = 0
+        self.ships_sunk = 0
+        if cells:
+            for key, state in cells.items():
+                self[key] = state
+
+    def state_at(self, index):
+        """Return the cell state (EMPTY..SUNK) of cell `index`."""
+        bit = 1 << index
+        if self.sunk_mask & bit:
+            return SUNK
+        if self.hits_mask & bit:
+            return HIT
+        if self.misses_mask & bit:
+            return MISS
+        if self.ships_mask & bit:
+            return SHIP
+        return EMPTY
+
+    # -------------------- Mapping Adapter --------------------
+    def __getitem__(self, key):
+        return self.state_at(KEY_INDEX[key])
+
+    def __setitem__(self, key, value):
+        bit = 1 << KEY_INDEX[key]
+        was_intact = self.ships_mask & ~self.hits_mask & bit
+        clear = ~bit
+        self.ships_mask &= clear
+        self.hits_mask &= clear
+        self.misses_mask &= clear
+        self.sunk_mask &= clear
+        if value in (SHIP, HIT, SUNK):
+            self.ships_mask |= bit
+        if value in (HIT, SUNK):
+            self.hits_mask |= bit
+        if value == SUNK:
+            self.sunk_mask |= bit
+        elif value == MISS:
+            self.misses_mask |= bit
+        is_intact = self.ships_mask & ~self.hits_mask & bit
+        self.ship_cells_left += bool(is_intact) - bool(was_intact)
+
+    def __contains__(self, key):
+        return key in KEY_INDEX
+
+    def __iter__(self):
+        return iter(BOARD_KEYS)
+
+    def __len__(self):
+        return CELL_COUNT
+
+    def get(self, key, default=None):
+        index = KEY_INDEX.get(key)
+        if index is None:
+            return default
+        return self.state_at(index)
+
+    def keys(self):
+        return list(BOARD_KEYS)
+
+    def values(self):
+        return [self.state_at(index) for index in range(CELL_COUNT)]
+
+    def items(self):
+        return [(key, self.state_at(index)) for index, key in enumerate(BOARD_KEYS)]
+
+    def copy(self):
+        """Return an independent copy of the board and its fleet."""
+        board = Board()
+        board.ships_mask = self.ships_mask
+        board.hits_mask = self.hits_mask
+        board.misses_mask = self.misses_mask
+        board.sunk_mask = self.sunk_mask
+        board.fleet = list(self.fleet)
+        board.ships = [list(ship) for ship in self.ships]
+        board.ship_masks = list(self.ship_masks)
+        board.cell_parts = list(self.cell_parts)
+        board.ship_remaining = list(self.ship_remaining)
+        board.ship_cells_left = self.ship_cells_left
+        board.shots = self.shots
+        board.hits = self.hits
+        board.misses = self.misses
+        board.ships_sunk = self.ships_sunk
+        return board
+
+    def to_dict(self):
+        """Return the board as a plain ``{"A1": state}`` dict (e.g. for JSON)."""
+        return dict(self.items())
+
+    # -------------------- Rules --------------------
+    def place_fleet(self, fleet):
+        """Place a fleet on the board and index every cell to its ship part.
+
+        Any ships already on the board are replaced. The index is built once
+        here, so resolving a shot (and knowing whether it sank a ship) takes
+        constant time whatever the fleet size.
+
+        Args:
+            fleet (list): Placement tuples, one per ship.
+        """
+        self.fleet = [Placement(*placement) for placement in fleet]
+        self.ships = []
+        self.ship_masks = []
+        self.cell_parts = [None] * CELL_COUNT
+        self.ship_remaining = []
+        self.ships_mask = 0
+        for ship_index, placement in enumerate(self.fleet):
+            cells = placement_cells(placement)
+            mask = 0
+            for part_index, index in enumerate(cells):
+                mask |= 1 << index
+                self.cell_parts[index] = (ship_index, part_index)
+            self.ships.append([BOARD_KEYS[index] for index in cells])
+            self.ship_masks.append(mask)
+            self.ship_remaining.append(len(cells))
+            self.ships_mask |= mask
+        self.ship_cells_left = (self.ships_mask & ~self.hits_mask).bit_count()
+
+    def is_attacked(self, key):
+        """Return True if `key` has already been hit or missed."""
+        return bool((self.hits_mask | self.misses_mask) >> KEY_INDEX[key] & 1)
+
+    def fire(self, key):
+        """Resolve a shot at `key` against this board.
+
+        Args:
+            key (str): Target board coordinate (e.g. 'A1').
+
+        Returns:
+            ShotResult: What the shot did. Boards are only changed for
+            'miss', 'hit' and 'sunk'.
+        """
+        index = KEY_INDEX.get(key)
+        if index is None:
+            return ShotResult('invalid', key, None, None, ())
+        bit = 1 << index
+        if (self.hits_mask | self.misses_mask) & bit:
+            return ShotResult('already', key, None, None, ())
+
+        self.shots += 1
+        if not self.ships_mask & bit:
+            self.misses_mask |= bit
+            self.misses += 1
+            return ShotResult('miss', key, None, None, ())
+
+        self.hits_mask |= bit
+        self.hits += 1
+        self.ship_cells_left -= 1
+        part = self.cell_parts[index]
+        if part is None:
+            # Ship cell with no registered fleet (e.g. a board received over the network)
+            return ShotResult('hit', key, None, None, ())
+
+        ship_index, part_index = part
+        self.ship_remaining[ship_index] -= 1
+        # A ship sinks once every one of its cells has been hit
+        if self.ship_remaining[ship_index] == 0:
+            self.sunk_mask |= self.ship_masks[ship_index]
+            self.ships_sunk += 1
+            return ShotResult('sunk', key, ship_index, part_index, tuple(self.ships[ship_index]))
+        return ShotResult('hit', key, ship_index, part_index, ())
+
+    def record(self, key, result, sunk_keys=()):
+        """Apply a shot result resolved elsewhere (e.g. by the opponent's machine).
+
+        Args:
+            key (str): Target board coordinate.
+            result (str): 'miss', 'hit' or 'sunk'.
+            sunk_keys (iterable): Cells of the sunk ship when result is 'sunk'.
+        """
+        if result == 'miss':
+            self[key] = MISS
+            self.misses += 1
+        elif result == 'hit':
+            self[key] = HIT
+            self.hits += 1
+        elif result == 'sunk':
+            self[key] = SUNK
+            for part in sunk_keys:
+                self[part] = SUNK
+            self.hits += 1
+            self.ships_sunk += 1
+        else:
+            return
+        self.shots += 1
+
+    def has_ships_left(self):
+        """Return True if any ship part on the board is still intact."""
+        return self.ship_cells_left > 0
+
+    @property
+    def accuracy(self):
+        """Fraction of shots received that hit a ship (0.0 before the first shot)."""
+        return self.hits / self.shots if self.shots else 0.0
+
+    def stats(self):
+        """Return the live shot counters for this board as a dict."""
+        return {
+            'shots': self.shots,
+            'hits': self.hits,
+            'misses': self.misses,
+            'ships_sunk': self.ships_sunk,
+            'ship_cells_left': self.ship_cells_left,
+            'accuracy': self.accuracy,
+        }
+
+
+class Game:
+    """Two boards, whose turn it is and who (if anyone) has won."""
+
+    def __init__(self):
+        self.boards = {1: Board(), 2: Board()}
+        self.current_player = 1
+        self.winner = None
+
+    @staticmethod
+    def opponent(player_number):
+        """Return the other player's number."""
+        return 2 if player_number == 1 else 1
+
+    def board(self, player_number):
+        """Return the board belonging to `player_number`."""
+        return self.boards[player_number]
+
+    def place_fleet(self, player_number, fleet):
+        """Place `player_number`'s fleet, given as Placement tuples."""
+        self.boards[player_number].place_fleet(fleet)
+
+    def fire(self, attacker, key):
+        """Resolve an attack by `attacker` on the defender's board.
+
+        Valid shots end the attacker's turn, or the game if the defender has no
+        ship parts left.
+
+        Args:
+            attacker (int): The attacking player (1 or 2).
+            key (str): The target board coordinate (e.g. 'A1').
+
+        Returns:
+            ShotResult: Result of the shot.
+        """
+        defender = self.opponent(attacker)
+        shot = self.boards[defender].fire(key)
+        if shot.result in ('invalid', 'already'):
+            return shot
+
+        if not self.boards[defender].has_ships_left():
+            self.winner = attacker
+        else:
+            self.current_player = defender
+        return shot
+
+    def stats(self, player_number):
+        """Return `player_number`'s shooting statistics (counted on the opponent's board)."""
+        return self.boards[self.opponent(player_number)].stats()
+
+    def is_over(self):
+        """Return True once a player has sunk the whole opposing fleet."""
+        return self.winner is not None
@@ -1,22 +1,28 @@
 import arcade
-from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, TextGroup
 
 class GameOverView(arcade.View):
     """
     View shown when the game has ended, displaying the winner and options to exit or restart.
     """
-    def __init__(self, main_game_window, winner_player_number):
-        # Reference to the main game window to allow restarting the game
+    # Static screen: the window may drop to its idle frame rate
+    idle_ok = True
+
+    def __init__(self, game, winner_player_number):
+        # Reference to the game controller to allow restarting the game
         super().__init__()
         self.winner = winner_player_number
         self.message = f"VICTORY! PLAYER {winner_player_number} HAS SUNK ALL OPPONENT SHIPS!"
-        self.game = main_game_window
+        self.game = game
+        # Cached text objects drawn as one batch
+        self.texts = TextGroup()
 
     def on_draw(self):
         """Render the game over screen with victory message and controls info."""
         self.clear()
         # Draw victory message, green text if message contains "VICTORY"
-        arcade.draw_text(
+        self.texts.set(
+            "message",
             self.message,
             SCREEN_WIDTH / 2,
             SCREEN_HEIGHT / 2 + 50,
@@ -26,14 +32,16 @@ class GameOverView(arcade.View):
         )
         
         # Draw instructions for exiting or restarting game
-        arcade.draw_text(
-            "Press ESC to exit or R to play again.",
+        self.texts.set(
+            "instructions",
+            "Press ESC to exit, R to play again or M for the main menu.",
             SCREEN_WIDTH / 2,
             SCREEN_HEIGHT / 2 - 50,
             arcade.color.WHITE,
             font_size=20,
             anchor_x="center",
         )
+        self.texts.draw()
 
     def on_key_press(self, key, modifiers):
         """Handle key input for quitting or restarting the game."""
@@ -43,14 +51,22 @@ class GameOverView(arcade.View):
         elif key == arcade.key.R:
             # Reset game state and return to initial connection/setup screen
             self.game.reset_game_state()
+        elif key == arcade.key.M:
+            # Back to mode selection in the same window
+            self.window.show_menu()
             
 
 class WaitingView(arcade.View):
     """View displayed during hotseat transitions, prompting the next player to get ready."""
-    def __init__(self, game_window, next_player_number):
+    # Static screen: the window may drop to its idle frame rate
+    idle_ok = True
+
+    def __init__(self, game, next_player_number):
         super().__init__()
-        self.window = game_window
+        self.game = game
         self.next_player_number = next_player_number
+        # Cached text objects drawn as one batch
+        self.texts = TextGroup()
 
     def on_show_view(self):
         """Set background color when view is shown."""
@@ -63,7 +79,8 @@ class WaitingView(arcade.View):
         prompt = f"Player {self.next_player_number} press [Space] when ready."
 
         # Display the message about whose turn is next
-        arcade.draw_text(
+        self.texts.set(
+            "message",
             message,
             self.window.width / 2,
             self.window.height / 2 + 50,
@@ -73,7 +90,8 @@ class WaitingView(arcade.View):
         )
         
         # Display prompt to press [Space] to continue
-        arcade.draw_text(
+        self.texts.set(
+            "prompt",
             prompt,
             self.window.width / 2,
             self.window.height / 2 - 50,
@@ -81,8 +99,9 @@ class WaitingView(arcade.View):
             24,
             anchor_x="center"
         )
+        self.texts.draw()
 
     def on_key_press(self, key, modifiers):
         """Detect spacebar press to continue to the next player's battle view."""
         if key == arcade.key.SPACE:
-            self.window.show_player_battle(self.next_player_number)
\ No newline at end of file
+            self.game.show_player_battle(self.next_player_number)
\ No newline at end of file
@@ -0,0 +1,76 @@
+import time
+
+# Frame intervals (seconds) while something is happening and while the screen is static
+ACTIVE_RATE = 1 / 60
+IDLE_RATE = 1 / 4
+# Seconds without input, network messages or view changes before dropping to IDLE_RATE
+IDLE_AFTER = 1.0
+
+
+class IdleWindowMixin:
+    """Mixin for arcade.Window subclasses that throttles frames while nothing changes.
+
+    Views opt in by exposing a truthy ``idle_ok`` attribute (or property) while
+    their content is static. Input events, view changes and explicit
+    ``mark_dirty()`` calls (e.g. for network messages) record activity; once the
+    current view is idle-capable and nothing has happened for IDLE_AFTER seconds
+    the update/draw rate drops to IDLE_RATE, and the next event restores it.
+
+    Usage:
+        class GameWindow(IdleWindowMixin, arcade.Window): ...
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.idle = False
+        self.last_activity = time.perf_counter()
+
+    def mark_dirty(self):
+        """Record activity and return to the full frame rate immediately."""
+        self.last_activity = time.perf_counter()
+        if self.idle:
+            self.idle = False
+            self.set_update_rate(ACTIVE_RATE)
+            self.set_draw_rate(ACTIVE_RATE)
+            print("[IDLE] Activity detected, back to full frame rate.")
+
+    def update_idle(self):
+        """Drop to the idle frame rate once a static view has seen no activity for a while."""
+        if self.idle or not getattr(self.current_view, 'idle_ok', False):
+            return
+        if time.perf_counter() - self.last_activity >= IDLE_AFTER:
+            self.idle = True
+            self.set_update_rate(IDLE_RATE)
+            self.set_draw_rate(IDLE_RATE)
+            print("[IDLE] Screen static, dropping frame rate.")
+
+    # -------------------- Activity Sources --------------------
+    # Window-level handlers run after the current view's own handlers.
+
+    def show_view(self, new_view):
+        super().show_view(new_view)
+        self.mark_dirty()
+
+    def on_update(self, delta_time):
+        self.update_idle()
+
+    def on_key_press(self, symbol, modifiers):
+        self.mark_dirty()
+
+    def on_key_release(self, symbol, modifiers):
+        self.mark_dirty()
+
+    def on_mouse_press(self, x, y, button, modifiers):
+        self.mark_dirty()
+
+    def on_mouse_release(self, x, y, button, modifiers):
+        self.mark_dirty()
+
+    def on_mouse_motion(self, x, y, dx, dy):
+        self.mark_dirty()
+
+    def on_mouse_drag(self, x, y, dx, dy, buttons, modifiers):
+        self.mark_dirty()
+
+    def on_mouse_scroll(self, x, y, scroll_x, scroll_y):
+        self.mark_dirty()
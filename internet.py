@@ -1,49 +1,47 @@
-import arcade
-import threading
-import socket
-import json
 import sys
 import time
 
+import discovery
+import protocol
+import transport
+
 # NOTE: You must ensure these imports point to your correctly defined files
 from setup import SetupView 
 from battle import BattleView
 from connect import ConnectView 
 from internet_other_screens import GameOverView, WaitingView 
-from constants import SCREEN_WIDTH, SCREEN_HEIGHT, player1_board, player2_board, SQUARE_SIZE, blank_board 
-
-# ----------------- Utility for showing local IP ------------------
+from engine import Game, Board, Placement
+from session import MatchSession, new_match_id
+from views import ViewManager
 
-def get_local_ip():
-    """Get the non-loopback local IP address.
+# Shot results as sent in ATTACK_RESPONSE messages
+RESULT_CODES = {'miss': 0, 'hit': 1, 'sunk': 2}
+RESULT_NAMES = {code: name for name, code in RESULT_CODES.items()}
 
-    Attempts to create a UDP connection to a public server to discover the local IP.
-    Falls back to hostname resolution if the above fails.
-    """
-    try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80)) 
-        ip = s.getsockname()[0]
-        s.close()
-        return ip
-    except:
-        return socket.gethostbyname(socket.gethostname())
+# Seconds a dropped match stays resumable, and between client reconnect attempts
+RESUME_WINDOW = 30.0
+RESUME_RETRY = 1.0
 
+# ----------------- InternetGame Class (Mode Controller) -----------------
 
-# ----------------- InternetGame Class (Main Window) -----------------
+class InternetGame:
+    """Network mode controller: drives the flow between connect, setup and battle views on the game window.
 
-class InternetGame(arcade.Window):
-    """Main Internet Game class controlling the flow between setup and battle views."""
+    Args:
+        window (GameWindow): The session's window; views are shown on it.
+    """
 
-    def __init__(self):
-        super().__init__(SCREEN_WIDTH, SCREEN_HEIGHT, "Battleship Internet")
+    def __init__(self, window):
+        self.window = window
         
-        # Player setup data and game boards (copy blank boards)
+        # Player setup data, and the headless rules engine holding both boards
         self.player1_setup_data = None
         self.player2_setup_data = None
-        
-        self.player1_board = blank_board.copy()
-        self.player2_board = blank_board.copy()
+
+        self.game = Game()
+
+        # One setup, battle and waiting view per player, reused every turn and game
+        self.views = ViewManager()
 
         # Current player (1 or 2), host is player 1 and always starts first
         self.current_player = 1 
@@ -51,88 +49,148 @@ class InternetGame(arcade.Window):
         # Networking attributes
         self.port = 5555
         self.host_ip = None 
-        self.server_socket = None
-        self.client_socket = None 
-        self.game_role = None # 'host' or 'client'
+        self.listener = None # transport.Listener while hosting
+        self.announcer = None # discovery.Announcer advertising our open game on the LAN
+        self.connection = None # transport.Connection to the opponent
+        self.connect_future = None # Pending join attempt, cancellable
+        # Network-thread callbacks queue work here; drained once per frame in on_update
+        self.dispatcher = transport.MessageDispatcher()
+        # Commands produced during a frame, sent as one batch by flush_outbox
+        self.outbox = []
+        self.game_role = None # 'host' or 'client' (player 1 or 2)
+        self.server_mode = False # Playing through a dedicated match server (server.py) instead of peer-to-peer
+        self.wire_version = None # Negotiated binary protocol version, None = JSON
+        self.session = None # MatchSession: sequence numbers and delta log for the current match
+        self.resume_deadline = None # Set while a dropped match waits to be resumed
+        self.next_resume_attempt = 0.0
+        self.resume_started = None
+        # Heartbeat settings for the opponent connection (seconds)
+        self.heartbeat_interval = transport.HEARTBEAT_INTERVAL
+        self.heartbeat_timeout = transport.HEARTBEAT_TIMEOUT
         
         # Start connection screen
         self.show_connection_screen()
 
+    # -------------------- Game State Accessors --------------------
+    @property
+    def current_player(self):
+        """Player (1 or 2) whose turn it is, as tracked by the engine."""
+        return self.game.current_player
+
+    @current_player.setter
+    def current_player(self, player_number):
+        self.game.current_player = player_number
+
+    @property
+    def player1_board(self):
+        return self.game.boards[1]
+
+    @property
+    def player2_board(self):
+        return self.game.boards[2]
+
+    @property
+    def status_message(self):
+        """Connection status line for views to show, or None when connected normally."""
+        if self.resume_deadline is not None:
+            return "Connection lost - reconnecting..."
+        if self.server_mode and self.connection and self.game_role is None:
+            return "Waiting for the server to find an opponent..."
+        if self.connection and self.connection.rtt is not None:
+            return f"Ping: {self.connection.rtt * 1000:.0f} ms"
+        return None
+
     # =========================================================================
-    # 1. NETWORKING UTILITIES (Send/Receive/Listen)
+    # 1. NETWORKING UTILITIES (Send/Receive, driven by the asyncio transport)
     # =========================================================================
 
     def send_data(self, data):
-        """JSON serialize and send data over the client socket with length prefix."""
-        if not self.client_socket:
-            print("Error: Client socket not available for sending.")
+        """Queue a command for the opponent; flush_outbox sends the frame's commands together."""
+        if self.session:
+            # Game commands are sequenced and logged so a resumed session can replay them
+            data = self.session.stamp(data)
+
+        if not self.connection:
+            if self.resume_deadline is None:
+                print("Error: No connection available for sending.")
             return
 
-        try:
-            message = json.dumps(data).encode('utf-8')
-            length_prefix = f"{len(message):<10}"
-            self.client_socket.sendall(length_prefix.encode('utf-8') + message)
-        except Exception as e:
-            print(f"Error sending data: {e}")
-            self._handle_disconnect_scheduled()
-
-    def receive_data(self):
-        """Receive a full message with length prefix and deserialize JSON."""
-        if not self.client_socket:
-            return None
-            
-        try:
-            length_prefix = self.client_socket.recv(10).decode('utf-8').strip()
-            if not length_prefix:
-                return None
-                
-            message_length = int(length_prefix)
-            
-            full_message = b''
-            bytes_received = 0
-            while bytes_received < message_length:
-                chunk = self.client_socket.recv(min(message_length - bytes_received, 2048))
-                if not chunk:
-                    break
-                full_message += chunk
-                bytes_received += len(chunk)
-            
-            if bytes_received < message_length:
-                 print("Warning: Did not receive full message.")
-                 return None
-
-            return json.loads(full_message.decode('utf-8'))
-
-        except ConnectionResetError:
-            print("Connection forcibly closed by the remote host.")
-            arcade.schedule(lambda dt: self._handle_disconnect_scheduled(), 0)
-            return None
-        except Exception:
-            if self.client_socket:
-                arcade.schedule(lambda dt: self._handle_disconnect_scheduled(), 0)
-            return None
-
-    def _listen_for_data(self):
-        """Background thread continuously listening and scheduling received messages."""
-        while self.client_socket:
-            data = self.receive_data()
-            if data is None:
-                break
-                
-            arcade.schedule(lambda dt: self._process_command(data), 0)
-            
-        print("Network listener thread stopped.")
+        self.outbox.append(data)
+
+    def flush_outbox(self):
+        """Send everything queued this frame as one frame (binary once negotiated, else JSON)."""
+        if not self.outbox or not self.connection:
+            return
+        # A single command goes out as-is; several become one batch (_process_command takes lists)
+        batch = self.outbox[0] if len(self.outbox) == 1 else self.outbox
+        self.outbox = []
+        self.connection.send(protocol.encode(batch, self.wire_version))
+
+    def update(self, delta_time):
+        """Called by the window every frame: run queued network work, then send this frame's outgoing commands."""
+        self.dispatcher.drain()
+        self.update_resume()
+        self.flush_outbox()
+
+    def _on_network_message(self, data):
+        """Called on the network thread for every decoded message; queues it for the main thread."""
+        self.dispatcher.post(self._process_command, data)
+
+    def _on_connection_closed(self, connection, error):
+        """Called on the network thread when a connection ends; handles it on the main thread."""
+        if error:
+            print(f"Connection error: {error}")
+        self.dispatcher.post(self._handle_connection_lost, connection)
+
+    def _handle_connection_lost(self, connection):
+        """Try to resume the match (or disconnect) unless the lost connection was already replaced or closed by us."""
+        if connection is None or connection is not self.connection:
+            return
+        if self.session and not self.game.is_over():
+            self._begin_resume()
+        else:
+            self._handle_disconnect()
 
     def _process_command(self, data):
         """Process incoming network commands on the main thread."""
+        # Network messages count as activity and wake an idle window
+        self.window.mark_dirty()
+
         if isinstance(data, list):
             for item in data:
                 self._process_command(item)
             return
+
+        if self.session and not self.session.accept(data):
+            return  # Already applied before a reconnect
         
         command = data.get("command")
         
-        if command == "ATTACK":
+        if command == "HELLO":
+            # Switch to the binary protocol once both peers support a common version
+            self.wire_version = protocol.negotiate(data.get("protocols"))
+            print(f"Wire protocol: {'binary v%d' % self.wire_version if self.wire_version else 'JSON'}")
+            # The client learns the match id from the host's greeting
+            if self.session and self.session.match_id is None:
+                self.session.match_id = data.get("match")
+            # A match server also tells us which player we are once it has paired us
+            if self.server_mode and self.game_role is None and data.get("player"):
+                self.game_role = 'host' if data["player"] == 1 else 'client'
+                self.show_player_setup(player_number=data["player"])
+
+        elif command == "RESUME":
+            self._handle_resume_request(data)
+
+        elif command == "RESUMED":
+            missing = self.session.missing(data.get("last_seq") or 0)
+            self.outbox.extend(missing)
+            self._finish_resume_handshake(len(missing))
+
+        elif command == "RESUME_REJECTED":
+            print("Host could not resume the match.")
+            self._handle_disconnect()
+
+        elif command == "ATTACK":
             key = data.get("target")
             self._handle_incoming_attack(key)
         
@@ -145,16 +203,21 @@ class InternetGame(arcade.Window):
 
         elif command == "SETUP_DATA":
             player_number = data.get("player")
-            ship_data = data.get("ship_data")
-            board_data = data.get("board_data")
-            
+            try:
+                # Rebuild the opponent's board straight from the canonical fleet placement
+                fleet = [Placement(*placement) for placement in data.get("fleet") or ()]
+                board = Board()
+                board.place_fleet(fleet)
+            except (TypeError, ValueError) as e:
+                print(f"Ignoring invalid setup data for Player {player_number}: {e}")
+                return
+
             if player_number == 1:
-                self.player1_setup_data = ship_data
-                self.player1_board = board_data
+                self.player1_setup_data = fleet
             else:
-                self.player2_setup_data = ship_data
-                self.player2_board = board_data
-                
+                self.player2_setup_data = fleet
+            self.game.boards[player_number] = board
+
             print(f"Received setup data for Player {player_number}.")
             
             if self.player1_setup_data and self.player2_setup_data:
@@ -162,7 +225,8 @@ class InternetGame(arcade.Window):
                 self.start_game()
         
         elif command == "START_GAME":
-            if self.player1_setup_data and self.player2_setup_data:
+            # A match server keeps the opponent's fleet to itself and just says when to start
+            if self.server_mode or (self.player1_setup_data and self.player2_setup_data):
                 self.start_game()
         else:
             print(f"Unknown command received: {command}")
@@ -173,91 +237,246 @@ class InternetGame(arcade.Window):
 
     def show_connection_screen(self):
         """Display initial connect view with Host/Join options."""
-        connect_view = ConnectView()
-        self.show_view(connect_view)
+        connect_view = ConnectView(self)
+        self.window.show_view(connect_view)
 
     def host_connect(self, host_ip):
         """Begin acting as server host and start listening for connection."""
         self.game_role = 'host'
         self.host_ip = host_ip
         self.start_server()
+        if self.listener:
+            # Let joiners on the LAN find us without typing an IP
+            self.announcer = discovery.Announcer(self.port)
 
     def join_connect(self, host_ip):
-        """Attempt to connect as a client to the host server."""
+        """Start connecting to the host without blocking the window."""
         self.game_role = 'client'
-        port = 5555 
-        client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        
-        try:
-            print(f"Attempting to connect to {host_ip}:{port}...")
-            client_socket.connect((host_ip, port))
-            
-            print("Successfully connected to host!")
-            self.client_socket = client_socket
-            
-            threading.Thread(target=self._listen_for_data, daemon=True).start()
-            
-            # Client starts setup (Player 2)
-            self.show_player_setup(player_number=2)
-            
-        except socket.error as e:
+        self.server_mode = False
+        self.host_ip = host_ip
+        print(f"Attempting to connect to {host_ip}:{self.port}...")
+        self._start_connect(host_ip, self._finish_join)
+
+    def join_server(self, host_ip):
+        """Connect to a match server; it assigns our player number once an opponent is found."""
+        self.game_role = None
+        self.server_mode = True
+        self.host_ip = host_ip
+        print(f"Attempting to connect to {host_ip}:{self.port}...")
+        self._start_connect(host_ip, self._finish_join)
+
+    def _start_connect(self, host_ip, finish):
+        """Open a connection to the host in the background.
+
+        `finish(future, connection, error, host_ip, port)` runs on the main thread once the attempt resolves.
+        """
+        port = self.port
+
+        # Cancel any attempt still in flight before starting a new one
+        if self.connect_future:
+            self.connect_future.cancel()
+
+        connection = None
+
+        def on_close(error):
+            self._on_connection_closed(connection, error)
+
+        def on_message(data):
+            self._on_network_message(data)
+
+        future = transport.connect(host_ip, port, on_message, on_close, timeout=transport.CONNECT_TIMEOUT,
+                                   heartbeat_interval=self.heartbeat_interval,
+                                   heartbeat_timeout=self.heartbeat_timeout)
+        self.connect_future = future
+
+        def on_done(done):
+            nonlocal connection
+            if done.cancelled():
+                return
+            error = done.exception()
+            if error is None:
+                connection = done.result()
+            self.dispatcher.post(finish, done, connection, error, host_ip, port)
+
+        future.add_done_callback(on_done)
+
+    def _finish_join(self, future, connection, error, host_ip, port):
+        """Main-thread continuation of join_connect once the connect attempt resolves."""
+        if future is not self.connect_future:
+            # A newer attempt replaced this one
+            if connection:
+                connection.close()
+            return
+        self.connect_future = None
+
+        if error is not None:
             print(f"Connection failed: Could not reach host at {host_ip}:{port}")
-            print(f"Error details: {e}")
-            client_socket.close()
+            print(f"Error details: {error}")
+            return
+
+        print("Successfully connected to host!")
+        self.connection = connection
+        self.session = MatchSession()  # Match id arrives with the host's HELLO
+        self.send_data(protocol.hello_message())
+
+        if self.server_mode:
+            # Setup starts once the server pairs us and says which player we are
+            self.show_waiting_screen()
+            return
+
+        # Client starts setup (Player 2)
+        self.show_player_setup(player_number=2)
     
     def start_server(self):
-        """Start server thread to wait for incoming client connections."""
-        threading.Thread(target=self.wait_for_connection, daemon=True).start()
-    
-    def wait_for_connection(self):
-        """Listen for one client connection and then start data listener."""
+        """Start listening for a client on the network loop."""
         try:
-            self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            
-            self.server_socket.bind((self.host_ip, self.port))
-            self.server_socket.listen(1)
+            self.listener = transport.Listener(self.host_ip, self.port, self._on_client_accepted)
             print(f"Server listening on {self.host_ip}:{self.port}")
-
-            self.client_socket, address = self.server_socket.accept() 
-            
-            print(f"Connection established with client at {address}")
-            
-            threading.Thread(target=self._listen_for_data, daemon=True).start()
-            
-            arcade.schedule(self._start_host_setup, 0)
-            
-        except Exception as e:
+        except OSError as e:
             print(f"Server error: {e}")
 
-    def _start_host_setup(self, dt):
-        """Switch to player 1 setup view on the main thread after connection."""
+    def _on_client_accepted(self, sock, address):
+        """Network-thread callback for an accepted client; the first one becomes our opponent."""
+        if self.connection or not self.listener:
+            sock.close()  # Already playing against someone
+            return
+
+        print(f"Connection established with client at {address}")
+        connection = None
+
+        def on_close(error):
+            self._on_connection_closed(connection, error)
+
+        connection = transport.Connection(sock, self._on_network_message, on_close,
+                                          heartbeat_interval=self.heartbeat_interval,
+                                          heartbeat_timeout=self.heartbeat_timeout)
+        self.connection = connection
+
+        # One opponent per host: stop accepting and advertising
+        self.listener.close()
+        self.listener = None
+        if self.announcer:
+            self.announcer.close()
+            self.announcer = None
+
+        self.dispatcher.post(self._start_host_setup)
+
+    def _start_host_setup(self):
+        """Greet the client and switch to player 1 setup view on the main thread after connection."""
+        if self.resume_deadline is not None:
+            # A returning client: keep the match and wait for its RESUME
+            self.send_data(protocol.hello_message(self.session.match_id))
+            return
+
+        self.session = MatchSession(new_match_id())
+        self.send_data(protocol.hello_message(self.session.match_id))
         self.show_player_setup(player_number=1) 
-        arcade.unschedule(self._start_host_setup) 
 
-    def _handle_disconnect_scheduled(self):
-        """Scheduled handler to perform disconnect tasks safely on main thread."""
-        self._handle_disconnect()
-        
-    def _handle_disconnect(self):
-        """Clean up sockets and return to connection screen on disconnect."""
-        if self.client_socket:
-            self.client_socket.close()
-            self.client_socket = None
+    # -------------------- Session Resume --------------------
+
+    def _begin_resume(self):
+        """Keep the match after a dropped connection: the host listens again, the client reconnects."""
+        self.connection = None
+        self.outbox = []  # Sequenced commands are still in the session log and get replayed
+        self.wire_version = None
+        if self.resume_deadline is None:
+            self.resume_deadline = time.monotonic() + RESUME_WINDOW
+            self.resume_started = time.perf_counter()
+        self.next_resume_attempt = 0.0
+        self.window.mark_dirty()
+        print(f"Connection lost. Trying to resume match {self.session.match_id}...")
+
+        if self.game_role == 'host' and not self.server_mode and not self.listener:
+            self.start_server()
+
+    def update_resume(self):
+        """Retry reconnecting while a match is resumable and give up once the window closes."""
+        if self.resume_deadline is None:
+            return
+        now = time.monotonic()
+        if now >= self.resume_deadline:
+            print("Could not resume the match in time.")
+            self._handle_disconnect()
+            return
+        reconnects = self.game_role == 'client' or self.server_mode
+        if reconnects and not self.connection and not self.connect_future and now >= self.next_resume_attempt:
+            self.next_resume_attempt = now + RESUME_RETRY
+            self._start_connect(self.host_ip, self._finish_resume)
+
+    def _finish_resume(self, future, connection, error, host_ip, port):
+        """Main-thread continuation of a reconnect attempt: ask the host to resume the match."""
+        if future is not self.connect_future:
+            if connection:
+                connection.close()
+            return
+        self.connect_future = None
 
-        # Server socket is typically closed after client connects; ignored here.
-            
+        if error is not None:
+            print(f"Reconnect to {host_ip}:{port} failed: {error}")
+            return  # update_resume retries until the deadline
+
+        self.connection = connection
+        # Both go out in one frame; the host answers with RESUMED plus our missing deltas.
+        # The match id in HELLO tells a match server not to pair us with someone new.
+        my_player_number = 1 if self.game_role == 'host' else 2
+        self.send_data(protocol.hello_message(self.session.match_id))
+        self.send_data(dict(self.session.resume_message(), player=my_player_number))
+
+    def _handle_resume_request(self, data):
+        """Host side of RESUME: report what we applied and replay what the client missed."""
+        if self.resume_deadline is None or not self.session or data.get("match") != self.session.match_id:
+            print("Rejecting resume request for an unknown match.")
+            self.send_data({"command": "RESUME_REJECTED"})
+            return
+
+        self.send_data(self.session.resumed_message())
+        missing = self.session.missing(data.get("last_seq") or 0)
+        self.outbox.extend(missing)
+        self._finish_resume_handshake(len(missing))
+
+    def _finish_resume_handshake(self, replayed):
+        """Leave resume mode once both sides know which deltas the other still needs."""
+        outage = (time.perf_counter() - self.resume_started) * 1000
+        self.resume_deadline = None
+        self.resume_started = None
+        print(f"[RESUME] Match {self.session.match_id} resumed after {outage:.0f} ms, "
+              f"replaying {replayed} missed command(s).")
+
+    def _handle_disconnect(self):
+        """Close the connection and listener and return to connection screen on disconnect."""
+        self.close()
         print("Disconnected. Returning to connection screen.")
         self.show_connection_screen()
+
+    def close(self):
+        """Close every connection, listener and pending attempt; called when leaving network mode."""
+        if self.connection:
+            self.connection.close()
+            self.connection = None
+        if self.listener:
+            self.listener.close()
+            self.listener = None
+        if self.announcer:
+            self.announcer.close()
+            self.announcer = None
+        self.outbox = []
+        if self.connect_future:
+            self.connect_future.cancel()
+            self.connect_future = None
+        self.wire_version = None
+        self.session = None
+        self.resume_deadline = None
+        self.server_mode = False
+        self.views.clear()
         
     def reset_game_state(self):
         """Reset game data to allow a new match to start."""
         self.player1_setup_data = None
         self.player2_setup_data = None
-        self.player1_board = blank_board.copy()
-        self.player2_board = blank_board.copy()
+        self.game = Game()
         self.current_player = 1 
         self.game_role = None
+        self.session = None
 
     # =========================================================================
     # 3. GAME FLOW AND VIEW SWITCHING
@@ -266,52 +485,50 @@ class InternetGame(arcade.Window):
     def show_waiting_screen(self):
         """Display WaitingView to indicate opponent's turn."""
         print("Switching to Waiting View. Opponent's turn.")
-        waiting_view = WaitingView(self)
-        self.show_view(waiting_view)
+        waiting_view = self.views.get(("waiting",), lambda: WaitingView(self))
+        self.window.show_view(waiting_view)
         
     def show_player_setup(self, player_number):
         """Show SetupView for the specified player."""
         board = self.player1_board if player_number == 1 else self.player2_board
-        setup_view = SetupView(player_number, self, board)
-        self.show_view(setup_view)
+        setup_view = self.views.get(("setup", player_number), lambda: SetupView(player_number, self))
+        setup_view.reset(board)
+        self.window.show_view(setup_view)
 
     def show_player_battle(self, player_number):
-        """Show BattleView for the specified player, letting it handle turn logic."""
+        """Show BattleView for the specified player, updated for whose turn it is."""
         setup_data = self.player1_setup_data if player_number == 1 else self.player2_setup_data
         your_board = self.player1_board if player_number == 1 else self.player2_board
         opponents_board = self.player2_board if player_number == 1 else self.player1_board
 
-        battle_view = BattleView(
-            player_number, 
-            self, 
-            setup_data, 
-            your_board, 
-            opponents_board, 
-        )
-        self.show_view(battle_view)
+        battle_view = self.views.get(("battle", player_number), lambda: BattleView(player_number, self))
+        battle_view.prepare(setup_data, your_board, opponents_board)
+        self.window.show_view(battle_view)
 
     def show_end_screen(self, winner_player_number):
         """Show GameOverView indicating the winner."""
+        self.game.winner = winner_player_number  # A finished match is not resumed
         game_over_view = GameOverView(self, winner_player_number)
-        self.show_view(game_over_view)
+        self.window.show_view(game_over_view)
+        print(f"Network dispatch metrics: {self.dispatcher.metrics()}")
 
-    def on_setup_finished(self, player_number, ship_data, board):
+    def on_setup_finished(self, player_number, fleet, board):
         """Called by SetupView after player finishes ship placement.
 
-        Saves local data and sends it to opponent over the network.
+        Saves the fleet placement and its board locally and sends the placement to the opponent.
         """
         if player_number == 1:
-            self.player1_setup_data = ship_data
-            self.player1_board = board
+            self.player1_setup_data = fleet
         else:
-            self.player2_setup_data = ship_data
-            self.player2_board = board
-            
+            self.player2_setup_data = fleet
+
+        # SetupView placed the fleet on this board, building the cell -> (ship, part) index
+        self.game.boards[player_number] = board
+
         setup_message = {
             "command": "SETUP_DATA",
             "player": player_number,
-            "ship_data": ship_data,
-            "board_data": board
+            "fleet": fleet
         }
         self.send_data(setup_message)
         
@@ -336,7 +553,7 @@ class InternetGame(arcade.Window):
 
         Called by BattleView when player clicks on opponent's grid.
         """
-        if not self.client_socket:
+        if not self.connection:
             print("Cannot attack: No connection.")
             return
 
@@ -352,41 +569,13 @@ class InternetGame(arcade.Window):
         """Process an attack from opponent and respond accordingly."""
         your_player_number = 1 if self.game_role == 'host' else 2
         
-        board = self.player1_board if your_player_number == 1 else self.player2_board
-        ship_data = self.player1_setup_data if your_player_number == 1 else self.player2_setup_data
-        effected_ships = []
-        result = 0 # 0=Miss, 1=Hit, 2=Sunk
-        
-        if key in board and board.get(key) == 1:
-            board[key] = 2  # Mark hit
-            result = 1
-            
-            for ship in ship_data:
-                for part_index, part in enumerate(ship):
-                    (x, y, angle), hit = part
-                    
-                    # Convert coords to grid key
-                    col = int((x - (SCREEN_WIDTH - SQUARE_SIZE * 10) / 2) // SQUARE_SIZE)
-                    row = int((y - (SCREEN_HEIGHT - SQUARE_SIZE * 10) / 2) // SQUARE_SIZE)
-                    part_key = chr(ord('A') + row) + str(col + 1)
-
-                    if part_key == key:
-                        ship[part_index][1] = 1  # Mark hit flag
-                        if all(p[1] == 1 for p in ship):
-                            # Mark entire ship as destroyed
-                            for p in ship:
-                                (px, py, _), _ = p
-                                c = int((px - (SCREEN_WIDTH - SQUARE_SIZE * 10) / 2) // SQUARE_SIZE)
-                                r = int((py - (SCREEN_HEIGHT - SQUARE_SIZE * 10) / 2) // SQUARE_SIZE)
-                                destroyed_key = chr(ord('A') + r) + str(c + 1)
-                                if destroyed_key in board:
-                                    board[destroyed_key] = 4
-                                    effected_ships.append(destroyed_key)
-                            result = 2  # Ship sunk
-                        break
-        else:
-            if key in board and board.get(key) == 0:
-                board[key] = 3  # Mark miss
+        board = self.game.board(your_player_number)
+
+        # The engine resolves hit, miss and sinking on our own board
+        shot = board.fire(key)
+
+        result = RESULT_CODES.get(shot.result, 0)  # Invalid/repeat shots report a miss
+        effected_ships = list(shot.sunk_keys)
         
         check_end = self.check_if_game_end(your_player_number)
 
@@ -397,16 +586,10 @@ class InternetGame(arcade.Window):
             "effected_ships": effected_ships,
             "check_end": check_end
         }
-        self.send_data(response)
+        if not self.server_mode:
+            # A match server has already ruled on the shot and answered the attacker
+            self.send_data(response)
         
-        # Update local state
-        if your_player_number == 1:
-            self.player1_board = board
-            self.player1_setup_data = ship_data
-        else:
-            self.player2_board = board
-            self.player2_setup_data = ship_data
-
         if check_end:
             winner_number = 1 if your_player_number == 2 else 2
             print(f"Game Over! Player {winner_number} won.")
@@ -424,23 +607,17 @@ class InternetGame(arcade.Window):
         opponents_board = self.player2_board if your_player_number == 1 else self.player1_board
         
         if result == 0:  # Miss
-            opponents_board[key] = 3
             print(f"Attack on {key}: MISS")
         elif result == 1:  # Hit
-            opponents_board[key] = 2
             print(f"Attack on {key}: HIT")
         elif result == 2:  # Sunk
-            opponents_board[key] = 4
             print(f"Attack on {key}: SHIP SUNK!")
-            if effected_ships:
-                for part_key in effected_ships:
-                    opponents_board[part_key] = 4
-        
-        # Update tracking board locally
-        if your_player_number == 1:
-            self.player2_board = opponents_board
-        else:
-            self.player1_board = opponents_board
+
+        # Mirror the opponent's ruling on our tracking board
+        opponents_board.record(key, RESULT_NAMES.get(result, 'miss'), effected_ships or ())
+        stats = opponents_board.stats()
+        print(f"Your stats: {stats['shots']} shots, {stats['hits']} hits, {stats['misses']} misses, "
+              f"{stats['ships_sunk']} ships sunk ({stats['accuracy']:.0%} accuracy)")
             
         if check_end:
             self.show_end_screen(your_player_number)
@@ -453,9 +630,6 @@ class InternetGame(arcade.Window):
         self.show_player_battle(your_player_number)
 
     def check_if_game_end(self, player_number):
-        """Return True if the specified player has no remaining ship pieces."""
+        """Return True if the specified player has no remaining ship pieces (live counter, no scan)."""
         board = self.player1_board if player_number == 1 else self.player2_board
-        for value in board.values():
-            if value == 1:  # Ship piece unhit found
-                return False
-        return True  # No ship parts remain; game over
\ No newline at end of file
+        return not board.has_ships_left()
\ No newline at end of file
@@ -1,17 +1,20 @@
 import arcade
-from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, TextGroup
 import sys
 
 class GameOverView(arcade.View):
     """
     View shown when the game has ended, either in victory or defeat.
     """
-    def __init__(self, main_game_window, winner_player_number):
+    # Static screen: the window may drop to its idle frame rate
+    idle_ok = True
+
+    def __init__(self, game, winner_player_number):
         # Initialize the parent class (arcade.View)
         super().__init__()
         
-        # Store reference to the main game window so we can control transitions
-        self.game = main_game_window
+        # Store reference to the game controller so we can control transitions
+        self.game = game
         
         # Which player won the game
         self.winner = winner_player_number
@@ -27,16 +30,17 @@ class GameOverView(arcade.View):
             self.message = "VICTORY! YOU SUNK ALL OPPONENT SHIPS!"
         else:
             self.message = "DEFEAT! ALL YOUR SHIPS WERE SUNK!"
-        
-        # Stop any scheduled network-update callbacks from continuing after game end
-        arcade.unschedule(self.game._process_command)
+
+        # Cached text objects drawn as one batch
+        self.texts = TextGroup()
 
     def on_draw(self):
         """Render the game-over message and instructions."""
         self.clear()
         
         # Draw the win/lose message in green for victory or red for defeat
-        arcade.draw_text(
+        self.texts.set(
+            "message",
             self.message,
             SCREEN_WIDTH / 2,
             SCREEN_HEIGHT / 2 + 50,
@@ -46,14 +50,16 @@ class GameOverView(arcade.View):
         )
         
         # Draw instructions for restarting or exiting
-        arcade.draw_text(
-            "Press ESC to exit or R to return to connection screen.",
+        self.texts.set(
+            "instructions",
+            "Press ESC to exit, R for the connection screen or M for the main menu.",
             SCREEN_WIDTH / 2,
             SCREEN_HEIGHT / 2 - 50,
             arcade.color.WHITE,
             font_size=20,
             anchor_x="center",
         )
+        self.texts.draw()
 
     def on_key_press(self, key, modifiers):
         """Process key input for exiting or restarting."""
@@ -64,24 +70,35 @@ class GameOverView(arcade.View):
             # Reset game state and return to connection menu
             self.game.reset_game_state()
             self.game.show_connection_screen()
+        elif key == arcade.key.M:
+            # Back to mode selection in the same window; closes the connection
+            self.window.show_menu()
 
 
 class WaitingView(arcade.View):
     """View used while waiting for the opponent to submit a networked move."""
-    def __init__(self, game_window):
+    # Static screen: the window may drop to its idle frame rate until a message arrives
+    idle_ok = True
+
+    def __init__(self, game):
         # Initialize parent arcade.View class
         super().__init__()
         
-        # Store reference to the main game window for screen size access
-        self.window = game_window
-        
+        # Store reference to the game controller for its connection status
+        self.game = game
+
+        # Cached text objects drawn as one batch
+        self.texts = TextGroup()
+
+    def on_show_view(self):
         # Set a neutral background color while waiting
         arcade.set_background_color(arcade.color.LIGHT_GRAY)
         
     def on_draw(self):
         """Render the waiting message."""
         self.clear()
-        arcade.draw_text(
+        self.texts.set(
+            "message",
             "Waiting for Opponent's Move...",
             self.window.width / 2,
             self.window.height / 2,
@@ -89,6 +106,17 @@ class WaitingView(arcade.View):
             font_size=50,
             anchor_x="center",
         )
+        # Reconnect progress while a dropped match is being resumed
+        self.texts.set(
+            "status",
+            self.game.status_message or "",
+            self.window.width / 2,
+            self.window.height / 2 - 60,
+            arcade.color.DARK_RED,
+            font_size=20,
+            anchor_x="center",
+        )
+        self.texts.draw()
 
     # User input is intentionally disabled while waiting
     def on_key_press(self, key, modifiers):
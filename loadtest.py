@@ -0,0 +1,243 @@
+# loadtest.py
+"""Protocol load test: simulated players play full games against a match server.
+
+Each simulated player connects, sends HELLO, places a random fleet with
+SETUP_DATA, waits for START_GAME and then plays the ATTACK / ATTACK_RESPONSE
+exchange until one fleet is sunk, exactly as InternetGame does in server mode.
+Turn latency is the time from sending an ATTACK to receiving its
+ATTACK_RESPONSE. Results are printed as JSON so runs can be compared over time.
+
+By default a server.py is started on a local port for the run; pass
+--server-workers 0 to test a server that is already running.
+
+The generator itself can span several processes (--processes) so that it
+is not the bottleneck when measuring a sharded server.
+
+Usage:
+    python loadtest.py [--clients 200] [--games 1] [--shots random|scripted] [--processes 1]
+                       [--server-workers 1] [--host 127.0.0.1] [--port 5599] [--seed 1]
+"""
+import argparse
+import asyncio
+import concurrent.futures
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+import protocol
+from engine import BOARD_KEYS, Board, random_fleet
+from session import MatchSession
+
+GAME_TIMEOUT = 120.0  # Seconds before a stuck game counts as an error
+SERVER_START_TIMEOUT = 10.0
+
+
+class SimulatedPlayer:
+    """One protocol-speaking player on an asyncio stream."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.frames = protocol.FrameReader()
+        self.session = MatchSession()
+        self.version = None
+        self.pending = []
+
+    def send(self, data):
+        self.writer.write(protocol.encode(self.session.stamp(data), self.version))
+
+    async def next_message(self):
+        """Return the next game message, answering heartbeats on the way."""
+        while not self.pending:
+            data = await self.reader.read(65536)
+            if not data:
+                raise ConnectionError("Server closed the connection")
+            self.frames.feed(data)
+            for message in self.frames.messages():
+                for item in message if isinstance(message, list) else (message,):
+                    if item.get("command") == "PING":
+                        self.writer.write(protocol.encode_json({"command": "PONG", "sent": item.get("sent")}))
+                    elif item.get("command") != "PONG" and self.session.accept(item):
+                        self.pending.append(item)
+        return self.pending.pop(0)
+
+    async def expect(self, command):
+        message = await self.next_message()
+        if message.get("command") != command:
+            raise RuntimeError(f"Expected {command}, got {message.get('command')}")
+        return message
+
+
+def shot_order(policy, rng):
+    """Return the order a player fires in: shuffled, or a fixed row-by-row sweep."""
+    if policy == "scripted":
+        return list(BOARD_KEYS)
+    keys = list(BOARD_KEYS)
+    rng.shuffle(keys)
+    return keys
+
+
+async def play_game(host, port, rng, policy, results):
+    """Play one full game as one player, recording turn latencies into `results`."""
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.get_extra_info('socket').setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    player = SimulatedPlayer(reader, writer)
+    try:
+        player.send(protocol.hello_message())
+        hello = await player.expect("HELLO")
+        player.version = protocol.negotiate(hello.get("protocols"))
+        player.session.match_id = hello.get("match")
+        number = hello["player"]
+
+        fleet = random_fleet(rng)
+        own_board = Board()
+        own_board.place_fleet(fleet)
+        player.send({"command": "SETUP_DATA", "player": number, "fleet": fleet})
+        await player.expect("START_GAME")
+
+        targets = iter(shot_order(policy, rng))
+        turn = 1
+        while True:
+            if turn == number:
+                started = time.perf_counter()
+                player.send({"command": "ATTACK", "target": next(targets), "attacker": number})
+                response = await player.expect("ATTACK_RESPONSE")
+                results["latencies"].append(time.perf_counter() - started)
+                results["shots"] += 1
+                if response.get("check_end"):
+                    break
+            else:
+                attack = await player.expect("ATTACK")
+                own_board.fire(attack["target"])
+                if not own_board.has_ships_left():
+                    break
+            turn = 2 if turn == 1 else 1
+        results["games"] += 1
+    finally:
+        writer.close()
+
+
+async def run_player(host, port, games, rng, policy, results):
+    for _ in range(games):
+        try:
+            await asyncio.wait_for(play_game(host, port, rng, policy, results), GAME_TIMEOUT)
+        except (OSError, asyncio.TimeoutError, RuntimeError, KeyError, protocol.ProtocolError) as e:
+            results["errors"] += 1
+            results["last_error"] = repr(e)
+
+
+def percentile_ms(cuts, p):
+    return round(cuts[p - 1] * 1000, 3)
+
+
+async def run_players(host, port, clients, games, policy, seed):
+    """Run `clients` simulated players concurrently and return their combined results."""
+    results = {"games": 0, "shots": 0, "errors": 0, "latencies": [], "last_error": None}
+    master = random.Random(seed)
+    await asyncio.gather(*(run_player(host, port, games, random.Random(master.random()), policy, results)
+                           for _ in range(clients)))
+    return results
+
+
+def run_shard(host, port, clients, games, policy, seed):
+    """Process-pool entry point: one generator process's share of the players."""
+    return asyncio.run(run_players(host, port, clients, games, policy, seed))
+
+
+def run_load(args):
+    """Spread the players over --processes generator processes and merge what they measured."""
+    shares = [args.clients // args.processes + (i < args.clients % args.processes) for i in range(args.processes)]
+    started = time.perf_counter()
+    if args.processes == 1:
+        parts = [run_shard(args.host, args.port, args.clients, args.games, args.shots, args.seed)]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(args.processes) as pool:
+            futures = [pool.submit(run_shard, args.host, args.port, share, args.games, args.shots, args.seed + i)
+                       for i, share in enumerate(shares) if share]
+            parts = [future.result() for future in futures]
+    elapsed = time.perf_counter() - started
+
+    results = {"games": 0, "shots": 0, "errors": 0, "latencies": [], "last_error": None}
+    for part in parts:
+        for name in ("games", "shots", "errors", "latencies"):
+            results[name] += part[name]
+        results["last_error"] = part["last_error"] or results["last_error"]
+
+    latencies = results["latencies"]
+    report = {
+        "clients": args.clients,
+        "games_per_client": args.games,
+        "shot_policy": args.shots,
+        "generator_processes": args.processes,
+        "server_workers": args.server_workers,
+        "duration_s": round(elapsed, 3),
+        # Both players count a finished game, so halve for matches
+        "matches_completed": results["games"] // 2,
+        "matches_per_s": round(results["games"] / 2 / elapsed, 2),
+        "shots": results["shots"],
+        "shots_per_s": round(results["shots"] / elapsed, 1),
+        "errors": results["errors"],
+        "last_error": results["last_error"],
+    }
+    if len(latencies) >= 2:
+        cuts = statistics.quantiles(latencies, n=100)
+        report["turn_latency_ms"] = {
+            "p50": percentile_ms(cuts, 50),
+            "p95": percentile_ms(cuts, 95),
+            "p99": percentile_ms(cuts, 99),
+            "max": round(max(latencies) * 1000, 3),
+        }
+    return report
+
+
+def start_server(host, port, workers):
+    """Start server.py in a subprocess and wait until it accepts connections."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    process = subprocess.Popen([sys.executable, os.path.join(here, "server.py"), "--host", host,
+                                "--port", str(port), "--workers", str(workers)],
+                               stdout=subprocess.DEVNULL)
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection((host, port), timeout=0.5).close()
+            # Give sharded workers a moment to bind their own listeners too
+            time.sleep(0.2 * workers)
+            return process
+        except OSError:
+            time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError(f"Server did not start on {host}:{port}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Battleship protocol load test")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5599)
+    parser.add_argument("--clients", type=int, default=200, help="simulated players (paired into matches)")
+    parser.add_argument("--games", type=int, default=1, help="games each player plays in turn")
+    parser.add_argument("--shots", choices=("random", "scripted"), default="random", help="shot policy")
+    parser.add_argument("--processes", type=int, default=1, help="load generator processes")
+    parser.add_argument("--server-workers", type=int, default=1,
+                        help="start server.py with this many workers (0 = use a running server)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    if args.clients % 2:
+        parser.error("--clients must be even so every player gets an opponent")
+
+    server = start_server(args.host, args.port, args.server_workers) if args.server_workers else None
+    try:
+        report = run_load(args)
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
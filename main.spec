@@ -6,7 +6,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=[],
+    hiddenimports=['hotseat', 'internet', 'singleplayer'],  # Game modes are imported lazily by window.py
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
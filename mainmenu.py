@@ -13,13 +13,15 @@ class MainMenuView(arcade.View):
         # Create buttons for selecting game modes
         hotseat_button = arcade.gui.UIFlatButton(text="Hotseat Game", width=200)
         network_button = arcade.gui.UIFlatButton(text="Network Game", width=200)
+        computer_button = arcade.gui.UIFlatButton(text="Play vs Computer", width=200)
 
         # Arrange buttons vertically with spacing using a grid layout
         grid = arcade.gui.UIGridLayout(
-            column_count=1, row_count=2, vertical_spacing=20
+            column_count=1, row_count=3, vertical_spacing=20
         )
         grid.add(hotseat_button, col=0, row=0)
         grid.add(network_button, col=0, row=1)
+        grid.add(computer_button, col=0, row=2)
 
         # Center the grid on the screen using an anchor layout
         anchor = arcade.gui.UIAnchorLayout()
@@ -29,6 +31,7 @@ class MainMenuView(arcade.View):
         # Bind button clicks to call the start_game callback with appropriate mode
         hotseat_button.on_click = lambda e: self.on_start_game("hotseat")
         network_button.on_click = lambda e: self.on_start_game("network")
+        computer_button.on_click = lambda e: self.on_start_game("singleplayer")
 
     def on_show_view(self):
         # Set background color and enable GUI manager when view is shown
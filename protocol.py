@@ -0,0 +1,294 @@
+"""Wire protocol for network games.
+
+Messages are command dicts (``{"command": "ATTACK", "target": "B4", ...}``) at
+the application level. On the wire two framings can share one TCP stream and
+are told apart by their first bytes:
+
+  * JSON (fallback): 10-character ASCII length prefix, then UTF-8 JSON.
+  * Binary: 8-byte header ``b'BS' | version u8 | opcode u8 | length u32``,
+    then a compact payload: the command's sequence number and ack (u16 each,
+    0 = none; see session.py), then cells as single bytes and fleets as two
+    bytes per ship (see engine.encode_fleet).
+
+Peers send HELLO (always JSON) listing the binary versions they speak and
+switch to binary once both sides agree. Commands without a binary encoding
+always go out as JSON.
+"""
+import json
+import struct
+
+from engine import BOARD_KEYS, KEY_INDEX, encode_fleet, decode_fleet
+
+MAGIC = b'BS'
+VERSION = 3  # v3: payloads start with seq/ack; v2: SETUP_DATA carries the fleet placement
+SUPPORTED_VERSIONS = (VERSION,)
+
+HEADER = struct.Struct('!2sBBI')
+SEQ = struct.Struct('!HH')  # seq, ack
+JSON_PREFIX_LEN = 10
+
+# Opcodes for commands with a binary encoding
+OP_ATTACK = 1
+OP_ATTACK_RESPONSE = 2
+OP_SETUP_DATA = 3
+OP_START_GAME = 4
+OP_BATCH = 5  # Several frames sent as one (a list of commands)
+
+
+
+class ProtocolError(ValueError):
+    """Raised when a frame cannot be decoded."""
+
+
+def negotiate(peer_versions):
+    """Return the highest binary version both sides support, or None for JSON."""
+    common = set(SUPPORTED_VERSIONS) & set(peer_versions or ())
+    return max(common) if common else None
+
+
+def hello_message(match_id=None):
+    """Return the HELLO handshake advertising our binary versions (and the host's match id)."""
+    message = {"command": "HELLO", "protocols": list(SUPPORTED_VERSIONS)}
+    if match_id is not None:
+        message["match"] = match_id
+    return message
+
+
+# ----------------- JSON framing -----------------
+
+def encode_json(data):
+    """Frame `data` as length-prefixed JSON (fleets become [cell, horizontal, length] lists)."""
+    message = json.dumps(data).encode('utf-8')
+    return f"{len(message):<10}".encode('utf-8') + message
+
+
+# ----------------- Binary framing -----------------
+
+def _frame(opcode, payload):
+    return HEADER.pack(MAGIC, VERSION, opcode, len(payload)) + payload
+
+
+def _command_frame(opcode, data, body):
+    """Frame a single command, prefixing its body with seq/ack."""
+    return _frame(opcode, SEQ.pack(data.get("seq") or 0, data.get("ack") or 0) + body)
+
+
+def _encode_binary(data):
+    """Return a binary frame for `data`, or None if the command has no binary form."""
+    if isinstance(data, list):
+        frames = [_encode_binary(item) for item in data]
+        if any(frame is None for frame in frames):
+            return None
+        return _frame(OP_BATCH, b''.join(frames))
+
+    command = data.get("command")
+    if command == "ATTACK":
+        return _command_frame(OP_ATTACK, data, bytes((KEY_INDEX[data["target"]], data.get("attacker") or 0)))
+
+    if command == "ATTACK_RESPONSE":
+        sunk = [KEY_INDEX[key] for key in data.get("effected_ships") or ()]
+        body = bytes((KEY_INDEX[data["target"]], data["result"],
+                      int(bool(data.get("check_end"))), len(sunk))) + bytes(sunk)
+        return _command_frame(OP_ATTACK_RESPONSE, data, body)
+
+    if command == "SETUP_DATA":
+        return _command_frame(OP_SETUP_DATA, data, bytes((data["player"],)) + encode_fleet(data["fleet"]))
+
+    if command == "START_GAME":
+        return _command_frame(OP_START_GAME, data, b'')
+
+    return None
+
+
+def encode(data, version=None):
+    """Frame a command dict (or list of them) for the wire.
+
+    Args:
+        data (dict or list): Command(s) to send.
+        version (int or None): Negotiated binary version, None for JSON.
+
+    Returns:
+        bytes: A complete frame.
+    """
+    if version:
+        frame = _encode_binary(data)
+        if frame is not None:
+            return frame
+    return encode_json(data)
+
+
+def _decode_command(opcode, body):
+    """Decode the body of a single command (after its seq/ack prefix)."""
+    if opcode == OP_ATTACK:
+        return {"command": "ATTACK", "target": BOARD_KEYS[body[0]], "attacker": body[1]}
+
+    if opcode == OP_ATTACK_RESPONSE:
+        target, result, check_end, count = body[0], body[1], body[2], body[3]
+        return {
+            "command": "ATTACK_RESPONSE",
+            "target": BOARD_KEYS[target],
+            "result": result,
+            "effected_ships": [BOARD_KEYS[index] for index in body[4:4 + count]],
+            "check_end": bool(check_end),
+        }
+
+    if opcode == OP_SETUP_DATA:
+        return {"command": "SETUP_DATA", "player": body[0], "fleet": decode_fleet(body[1:])}
+
+    if opcode == OP_START_GAME:
+        return {"command": "START_GAME"}
+
+    raise ProtocolError(f"Unknown opcode {opcode}")
+
+
+def decode_binary(opcode, payload):
+    """Decode a binary payload into a command dict (or list for OP_BATCH)."""
+    try:
+        if opcode == OP_BATCH:
+            items = []
+            offset = 0
+            while offset < len(payload):
+                _, _, sub_opcode, length = HEADER.unpack_from(payload, offset)
+                offset += HEADER.size
+                items.append(decode_binary(sub_opcode, payload[offset:offset + length]))
+                offset += length
+            return items
+
+        seq, ack = SEQ.unpack_from(payload)
+        message = _decode_command(opcode, payload[SEQ.size:])
+        if seq:
+            message["seq"] = seq
+            message["ack"] = ack
+        return message
+    except ProtocolError:
+        raise
+    except (IndexError, KeyError, ValueError, struct.error) as e:
+        raise ProtocolError(f"Malformed frame for opcode {opcode}: {e}") from e
+
+
+def decode_json(payload):
+    """Decode a JSON payload (without its length prefix)."""
+    return json.loads(str(payload, 'utf-8'))
+
+
+# ----------------- Incremental frame reader -----------------
+
+# Returned by FrameReader.next_message when no complete frame is buffered yet
+INCOMPLETE = object()
+
+MAX_FRAME = 1 << 20  # Refuse frames over 1 MiB rather than growing without bound
+
+
+class FrameReader:
+    """Parses frames of either framing out of one preallocated receive buffer.
+
+    Bytes are read straight into a bytearray with ``recv_into`` and frames are
+    decoded from memoryview slices of it, so nothing is concatenated or copied
+    on the way. Partial headers/prefixes simply wait for more data, and one read
+    can yield several frames.
+
+    Usage:
+        reader = FrameReader()
+        while reader.recv_from(sock):
+            for message in reader.messages():
+                handle(message)
+    """
+
+    def __init__(self, size=65536):
+        self.buffer = bytearray(size)
+        self.view = memoryview(self.buffer)
+        self.start = 0  # First byte not yet parsed
+        self.end = 0    # End of received data
+
+    def _reserve(self, needed):
+        """Make room for `needed` bytes after self.start, compacting or growing the buffer."""
+        if self.start + needed <= len(self.buffer):
+            return
+        pending = self.end - self.start
+        if needed > len(self.buffer):
+            # Frame larger than the buffer: move to a bigger one
+            buffer = bytearray(max(needed, len(self.buffer) * 2))
+            buffer[:pending] = self.view[self.start:self.end]
+            self.buffer = buffer
+            self.view = memoryview(buffer)
+        else:
+            self.buffer[:pending] = self.buffer[self.start:self.end]
+        self.start = 0
+        self.end = pending
+
+    def free_view(self):
+        """Return a writable memoryview over the free space after the buffered data."""
+        if self.end == len(self.buffer):
+            self._reserve(self.end - self.start + 1)
+        return self.view[self.end:]
+
+    def commit(self, count):
+        """Mark `count` bytes written into free_view() as received."""
+        self.end += count
+
+    def recv_from(self, sock):
+        """Read whatever the socket has into free buffer space.
+
+        Returns:
+            int: Number of bytes read; 0 means the peer closed the connection.
+        """
+        count = sock.recv_into(self.free_view())
+        self.commit(count)
+        return count
+
+    def feed(self, data):
+        """Append bytes received some other way (e.g. an asyncio protocol)."""
+        self._reserve(self.end - self.start + len(data))
+        self.view[self.end:self.end + len(data)] = data
+        self.end += len(data)
+
+    def next_message(self):
+        """Decode and return the next complete frame, or INCOMPLETE if none is buffered."""
+        start = self.start
+        available = self.end - start
+        if available < len(MAGIC):
+            return INCOMPLETE
+
+        if self.view[start:start + len(MAGIC)] == MAGIC:
+            if available < HEADER.size:
+                return INCOMPLETE
+            _, _, opcode, length = HEADER.unpack_from(self.buffer, start)
+            header_size = HEADER.size
+        else:
+            if available < JSON_PREFIX_LEN:
+                return INCOMPLETE
+            try:
+                length = int(str(self.view[start:start + JSON_PREFIX_LEN], 'ascii'))
+            except ValueError as e:
+                raise ProtocolError(f"Bad length prefix: {e}") from e
+            opcode = None
+            header_size = JSON_PREFIX_LEN
+
+        total = header_size + length
+        if length > MAX_FRAME:
+            raise ProtocolError(f"Frame of {length} bytes exceeds limit")
+        if available < total:
+            self._reserve(total)
+            return INCOMPLETE
+
+        payload = self.view[self.start + header_size:self.start + total]
+        try:
+            if opcode is None:
+                message = decode_json(payload)
+            else:
+                message = decode_binary(opcode, payload)
+        finally:
+            payload.release()
+
+        self.start += total
+        if self.start == self.end:
+            self.start = self.end = 0
+        return message
+
+    def messages(self):
+        """Yield every complete message currently buffered."""
+        while True:
+            message = self.next_message()
+            if message is INCOMPLETE:
+                return
+            yield message
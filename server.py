@@ -0,0 +1,480 @@
+# server.py
+"""Headless match server: many clients, paired into authoritative matches.
+
+Clients speak the same commands as peer-to-peer games (see internet.py):
+
+  * HELLO      - client -> server on connect. Once paired, the server answers
+                 with HELLO carrying the match id and the client's ``player``
+                 number (1 moves first).
+  * SETUP_DATA - client -> server with its fleet. The server keeps both boards;
+                 fleets are never forwarded, so clients cannot see each other's ships.
+  * START_GAME - server -> both once both fleets are in.
+  * ATTACK     - attacker -> server. The server checks the turn, resolves the
+                 shot on its own boards, answers the attacker with
+                 ATTACK_RESPONSE and forwards the ATTACK to the defender so it
+                 can update its own view (the defender does not reply).
+  * RESUME     - a client whose connection dropped reconnects within
+                 RESUME_WINDOW seconds and continues its match (see session.py).
+
+Everything in a process runs on one asyncio loop, so match state needs no
+locking. With ``--workers N`` the server runs N worker processes that all
+listen on the port (SO_REUSEPORT) and a coordinator in the parent. Each match
+belongs to worker ``crc32(match_id) % N``; a RESUME that lands on another
+worker is handed to the owner by passing the client socket through the
+coordinator (socket.send_fds), and players left waiting alone on a worker are
+handed to worker 0 to be paired.
+
+Usage:
+    python server.py [--host 0.0.0.0] [--port 5555] [--workers N]
+"""
+import argparse
+import json
+import multiprocessing
+import selectors
+import socket
+import time
+import zlib
+
+import protocol
+import transport
+from engine import Game, Board, Placement, KEY_INDEX
+from session import MatchSession, new_match_id
+
+DEFAULT_PORT = 5555
+BACKLOG = 1024
+RESUME_WINDOW = 30.0  # Seconds a dropped player's slot is kept
+STATS_INTERVAL = 10.0  # Seconds between status lines
+LOBBY_DELAY = 1.0  # Seconds a lone waiting player stays on its worker before moving to worker 0
+CONTROL_BUFFER = 65536  # Largest control message between workers and the coordinator
+
+# Shot results as sent in ATTACK_RESPONSE messages (as in internet.py)
+RESULT_CODES = {'miss': 0, 'hit': 1, 'sunk': 2}
+
+
+def owner_of(match_id, worker_count):
+    """Return the index of the worker that owns `match_id`."""
+    return zlib.crc32(match_id.encode('utf-8')) % worker_count
+
+
+class ServerPlayer:
+    """One client connection and, once paired, its seat in a match."""
+
+    def __init__(self):
+        self.connection = None
+        self.version = None  # Negotiated binary protocol version, None = JSON
+        self.hello = None  # The client's HELLO, replayed if it is handed to another worker
+        self.session = MatchSession()
+        self.match = None
+        self.number = None
+
+
+class Match:
+    """Two seated players and the authoritative Game between them."""
+
+    def __init__(self, match_id, player1, player2):
+        self.match_id = match_id
+        self.players = {1: player1, 2: player2}
+        self.game = Game()
+        self.ready = set()  # Players whose fleet is placed
+        self.started = False
+
+
+class MatchServer:
+    """Accepts clients, pairs them into matches and referees every shot.
+
+    Args:
+        host (str): Address to bind.
+        port (int): Port to bind.
+        listen (bool): Open the listening socket; False when sockets are handed
+            in through ``adopt`` instead.
+        worker_index (int): This worker's index when sharded across processes.
+        worker_count (int): Number of worker processes.
+        control (socket.socket): SOCK_SEQPACKET link to the coordinator, if sharded.
+    """
+
+    def __init__(self, host="0.0.0.0", port=DEFAULT_PORT, net=None, listen=True,
+                 worker_index=0, worker_count=1, control=None):
+        self.net = net or transport.get_network_loop()
+        self.host = host
+        self.port = port
+        self.worker_index = worker_index
+        self.worker_count = worker_count
+        self.control = control
+        self.matches = {}  # match id -> Match
+        self.waiting = None  # Player waiting for an opponent
+        self.listener = None
+        # Counters for the status line
+        self.connections = 0
+        self.matches_started = 0
+        self.matches_finished = 0
+        self.shots = 0
+        if listen:
+            self.listener = transport.Listener(host, port, self.adopt, backlog=BACKLOG, net=self.net,
+                                               reuse_port=worker_count > 1)
+        if control:
+            self.net.call_soon(self._start_control)
+
+    # -------------------- Connections --------------------
+
+    def adopt(self, sock, address=None):
+        """Serve an accepted client socket and return its player; runs on the network loop."""
+        player = ServerPlayer()
+        connection = None
+
+        def on_message(data):
+            self._on_message(player, data)
+
+        def on_close(error):
+            self._on_close(player, connection)
+
+        connection = transport.Connection(sock, on_message, on_close, net=self.net)
+        player.connection = connection
+        self.connections += 1
+        return player
+
+    def send(self, player, data):
+        """Stamp and send a command to `player` if it is connected."""
+        data = player.session.stamp(data)
+        if player.connection:
+            player.connection.send(protocol.encode(data, player.version))
+
+    def _on_close(self, player, connection):
+        self.connections -= 1
+        if self.waiting is player:
+            self.waiting = None
+        if player.connection is not connection:
+            return  # Replaced by a resumed connection
+        player.connection = None
+        match = player.match
+        if match is None or match.match_id not in self.matches:
+            return
+        # Keep the seat open for a reconnect
+        self.net.loop.call_later(RESUME_WINDOW, self._expire_seat, match, player)
+
+    def _expire_seat(self, match, player):
+        """Abandon a match whose player never came back; the opponent is disconnected too."""
+        if match.players.get(player.number) is not player or player.connection is not None:
+            return  # Resumed in the meantime
+        self._end_match(match)
+        print(f"Match {match.match_id} abandoned.")
+
+    def _end_match(self, match):
+        self.matches.pop(match.match_id, None)
+        for seated in match.players.values():
+            if seated.connection:
+                seated.connection.close()
+
+    # -------------------- Commands --------------------
+
+    def _on_message(self, player, data):
+        if isinstance(data, list):
+            for item in data:
+                self._on_message(player, item)
+            return
+
+        if not player.session.accept(data):
+            return  # Already applied before a reconnect
+
+        command = data.get("command")
+        if command == "HELLO":
+            player.version = protocol.negotiate(data.get("protocols"))
+            player.hello = data
+            if data.get("match"):
+                # A reconnecting client; its RESUME follows in the same frame.
+                # If another worker owns the match, that worker greets it after the hand-off.
+                if self.owns(data["match"]):
+                    self.send(player, protocol.hello_message(data["match"]))
+            else:
+                self._pair(player)
+        elif command == "RESUME":
+            self._resume(player, data)
+        elif player.match is None:
+            return  # Nothing else means anything before pairing
+        elif command == "SETUP_DATA":
+            self._handle_setup(player, data)
+        elif command == "ATTACK":
+            self._handle_attack(player, data.get("target"))
+
+    def _pair(self, player):
+        """Seat `player` against whoever is waiting, or make it wait."""
+        opponent = self.waiting
+        if opponent is None or opponent.connection is None:
+            self.waiting = player
+            if self.control and self.worker_index != 0:
+                self.net.loop.call_later(LOBBY_DELAY, self._send_to_lobby, player)
+            return
+
+        self.waiting = None
+        match = Match(self._new_match_id(), opponent, player)
+        self.matches[match.match_id] = match
+        self.matches_started += 1
+        for number, seated in match.players.items():
+            seated.match = match
+            seated.number = number
+            seated.session.match_id = match.match_id
+            self.send(seated, dict(protocol.hello_message(match.match_id), player=number))
+
+    def _resume(self, player, data):
+        """Move a reconnecting client into its old seat and replay what it missed."""
+        match_id = data.get("match")
+        if self.control and isinstance(match_id, str) and not self.owns(match_id):
+            self._hand_off(player, [player.hello, data], worker=owner_of(match_id, self.worker_count))
+            return
+
+        match = self.matches.get(match_id)
+        number = data.get("player")
+        if match is None or number not in match.players:
+            self.send(player, {"command": "RESUME_REJECTED"})
+            return
+
+        seat = match.players[number]
+        old_connection = seat.connection
+        # The new connection takes over the seat's sequence state
+        player.session = seat.session
+        player.match = match
+        player.number = number
+        match.players[number] = player
+        if old_connection:
+            old_connection.close()  # Half-open leftover the heartbeat has not caught yet
+
+        self.send(player, player.session.resumed_message())
+        for delta in player.session.missing(data.get("last_seq") or 0):
+            player.connection.send(protocol.encode(delta, player.version))
+
+    def _handle_setup(self, player, data):
+        match = player.match
+        if match.started:
+            return
+        try:
+            fleet = [Placement(*placement) for placement in data.get("fleet") or ()]
+            board = Board()
+            board.place_fleet(fleet)
+        except (TypeError, ValueError) as e:
+            print(f"Match {match.match_id}: invalid fleet from player {player.number}: {e}")
+            return
+
+        match.game.boards[player.number] = board
+        match.ready.add(player.number)
+        if len(match.ready) == 2:
+            match.started = True
+            for seated in match.players.values():
+                self.send(seated, {"command": "START_GAME"})
+
+    def _handle_attack(self, player, key):
+        match = player.match
+        game = match.game
+        if not match.started or game.is_over() or game.current_player != player.number or key not in KEY_INDEX:
+            return  # Out of turn or malformed: the client never sends these
+
+        defender = game.opponent(player.number)
+        shot = game.fire(player.number, key)
+        if shot.result == 'already':
+            game.current_player = defender  # Repeats cost the turn, as in peer-to-peer games
+        self.shots += 1
+
+        self.send(player, {
+            "command": "ATTACK_RESPONSE",
+            "target": key,
+            "result": RESULT_CODES.get(shot.result, 0),
+            "effected_ships": list(shot.sunk_keys),
+            "check_end": game.is_over(),
+        })
+        self.send(match.players[defender], {"command": "ATTACK", "target": key, "attacker": player.number})
+
+        if game.is_over():
+            self.matches_finished += 1
+            # Leave the match resumable briefly so both final messages can still be replayed
+            self.net.loop.call_later(RESUME_WINDOW, self._end_match, match)
+
+    # -------------------- Sharding --------------------
+
+    def owns(self, match_id):
+        """Return True if this worker owns `match_id`."""
+        return owner_of(match_id, self.worker_count) == self.worker_index
+
+    def _new_match_id(self):
+        """Return a fresh match id that hashes to this worker."""
+        while True:
+            match_id = new_match_id()
+            if self.owns(match_id):
+                return match_id
+
+    def _send_to_lobby(self, player):
+        """Move a player still waiting alone to worker 0, where stragglers get paired."""
+        if self.waiting is player and player.connection:
+            self.waiting = None
+            self._hand_off(player, [player.hello], worker=0)
+
+    def _hand_off(self, player, messages, worker):
+        """Pass a client's socket and the messages it already sent to another worker."""
+        sock = player.connection.detach()
+        player.connection = None
+        self.connections -= 1
+        message = {"op": "handoff", "worker": worker, "messages": [m for m in messages if m]}
+        try:
+            socket.send_fds(self.control, [json.dumps(message).encode('utf-8')], [sock.fileno()])
+        except OSError as e:
+            print(f"Hand-off to worker {worker} failed: {e}")
+        finally:
+            sock.close()  # The receiving process holds its own reference now
+
+    def _start_control(self):
+        self.net.loop.add_reader(self.control.fileno(), self._on_control)
+        self._report_stats()
+
+    def _on_control(self):
+        """Adopt a client handed over by the coordinator."""
+        try:
+            data, fds, _, _ = socket.recv_fds(self.control, CONTROL_BUFFER, 1)
+        except OSError:
+            data, fds = b'', []
+        if not data:
+            self.net.loop.remove_reader(self.control.fileno())  # Coordinator went away
+            return
+        message = json.loads(data)
+        if message.get("op") == "adopt" and fds:
+            player = self.adopt(socket.socket(fileno=fds[0]))
+            for item in message.get("messages") or ():
+                self._on_message(player, item)
+
+    def _report_stats(self):
+        try:
+            self.control.send(json.dumps(dict(self.stats(), op="stats", worker=self.worker_index)).encode('utf-8'))
+        except OSError:
+            return
+        self.net.loop.call_later(STATS_INTERVAL, self._report_stats)
+
+    # -------------------- Reporting --------------------
+
+    def stats(self):
+        """Return the server's counters as a dict."""
+        return {
+            "connections": self.connections,
+            "active_matches": len(self.matches),
+            "matches_started": self.matches_started,
+            "matches_finished": self.matches_finished,
+            "shots": self.shots,
+        }
+
+    def close(self):
+        """Stop accepting new clients."""
+        if self.listener:
+            self.listener.close()
+            self.listener = None
+
+
+class Coordinator:
+    """Parent process of a sharded server: routes hand-offs between workers and sums their stats.
+
+    Args:
+        controls (list): One SOCK_SEQPACKET socket per worker, indexed by worker.
+    """
+
+    def __init__(self, controls):
+        self.controls = controls
+        self.worker_stats = {}
+        self.selector = selectors.DefaultSelector()
+        for index, control in enumerate(controls):
+            self.selector.register(control, selectors.EVENT_READ, index)
+
+    def owner_of(self, match_id):
+        """Return the worker index that owns `match_id`."""
+        return owner_of(match_id, len(self.controls))
+
+    def serve(self):
+        """Route messages until interrupted, printing totals every STATS_INTERVAL."""
+        next_report = time.monotonic() + STATS_INTERVAL
+        while True:
+            for key, _ in self.selector.select(timeout=max(0.0, next_report - time.monotonic())):
+                self._on_message(key.fileobj, key.data)
+            if time.monotonic() >= next_report:
+                next_report += STATS_INTERVAL
+                print(self.stats())
+
+    def _on_message(self, control, index):
+        data, fds, _, _ = socket.recv_fds(control, CONTROL_BUFFER, 1)
+        if not data:
+            print(f"Worker {index} exited.")
+            self.selector.unregister(control)
+            return
+        message = json.loads(data)
+        if message.get("op") == "stats":
+            self.worker_stats[index] = message
+        elif message.get("op") == "handoff" and fds:
+            target = self.controls[message["worker"]]
+            try:
+                adopt = {"op": "adopt", "messages": message.get("messages")}
+                socket.send_fds(target, [json.dumps(adopt).encode('utf-8')], fds)
+            finally:
+                for fd in fds:
+                    socket.close(fd)
+
+    def stats(self):
+        """Return totals across workers plus each worker's active match count."""
+        totals = {}
+        for stats in self.worker_stats.values():
+            for name, value in stats.items():
+                if name not in ("op", "worker"):
+                    totals[name] = totals.get(name, 0) + value
+        totals["active_per_worker"] = [self.worker_stats.get(i, {}).get("active_matches", 0)
+                                       for i in range(len(self.controls))]
+        return totals
+
+
+def run_worker(index, count, host, port, control):
+    """Entry point of one worker process."""
+    server = MatchServer(host, port, worker_index=index, worker_count=count, control=control)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.close()
+
+
+def serve_sharded(host, port, workers):
+    """Run `workers` worker processes on one port, coordinated from this process."""
+    context = multiprocessing.get_context("spawn")
+    controls, processes = [], []
+    for index in range(workers):
+        parent_end, child_end = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        process = context.Process(target=run_worker, args=(index, workers, host, port, child_end),
+                                  name=f"match-worker-{index}", daemon=True)
+        process.start()
+        child_end.close()
+        controls.append(parent_end)
+        processes.append(process)
+
+    print(f"Match server listening on {host}:{port} with {workers} workers")
+    try:
+        Coordinator(controls).serve()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for process in processes:
+            process.terminate()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless Battleship match server")
+    parser.add_argument("--host", default="0.0.0.0", help="address to bind")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="port to listen on")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="worker processes sharing the port (one per core scales across cores)")
+    args = parser.parse_args()
+
+    if args.workers > 1:
+        serve_sharded(args.host, args.port, args.workers)
+        return
+
+    server = MatchServer(args.host, args.port)
+    print(f"Match server listening on {args.host}:{args.port}")
+    try:
+        while True:
+            time.sleep(STATS_INTERVAL)
+            print(server.stats())
+    except KeyboardInterrupt:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
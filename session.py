@@ -0,0 +1,78 @@
+"""Per-match sequencing and delta log for resumable network games.
+
+Every game command a peer sends is stamped with a sequence number (``seq``)
+and the highest sequence number it has applied from the other side (``ack``).
+Sent commands stay in a delta log until the peer acknowledges them, so the
+log only ever holds the last turn or two. After a reconnect each side reports
+the last ``seq`` it applied (RESUME / RESUMED) and the other side replays just
+the deltas after it; nothing is restarted or resent in full.
+"""
+import collections
+import secrets
+
+# Connection-level commands: never sequenced, logged or replayed
+CONTROL_COMMANDS = frozenset({"HELLO", "RESUME", "RESUMED", "RESUME_REJECTED"})
+
+
+def new_match_id():
+    """Return a short random id naming one match (host side)."""
+    return secrets.token_hex(4)
+
+
+class MatchSession:
+    """Sequence numbers and unacknowledged deltas for one side of a match.
+
+    Args:
+        match_id (str or None): Match identifier; a client learns it from the
+            host's HELLO.
+    """
+
+    def __init__(self, match_id=None):
+        self.match_id = match_id
+        self.next_seq = 1
+        self.last_applied = 0  # Highest peer seq applied locally
+        self.log = collections.deque()  # Sent commands not yet acknowledged, oldest first
+
+    def stamp(self, data):
+        """Return `data` with seq/ack added and keep it in the log until acknowledged.
+
+        Control commands are returned unchanged.
+        """
+        if data.get("command") in CONTROL_COMMANDS:
+            return data
+        data = dict(data, seq=self.next_seq, ack=self.last_applied)
+        self.next_seq += 1
+        self.log.append(data)
+        return data
+
+    def acknowledge(self, ack):
+        """Drop logged deltas the peer has applied (everything up to `ack`)."""
+        while self.log and self.log[0]["seq"] <= ack:
+            self.log.popleft()
+
+    def accept(self, data):
+        """Record an incoming command; return False if it was already applied.
+
+        Unsequenced (control) commands are always accepted.
+        """
+        seq = data.get("seq")
+        if seq is None:
+            return True
+        if seq <= self.last_applied:
+            return False  # Replayed duplicate
+        self.last_applied = seq
+        self.acknowledge(data.get("ack") or 0)
+        return True
+
+    def missing(self, peer_last_applied):
+        """Return the logged deltas the peer has not applied yet, in order."""
+        self.acknowledge(peer_last_applied)
+        return list(self.log)
+
+    def resume_message(self):
+        """Return the RESUME request a reconnecting client sends."""
+        return {"command": "RESUME", "match": self.match_id, "last_seq": self.last_applied}
+
+    def resumed_message(self):
+        """Return the host's RESUMED reply, reporting what it has applied."""
+        return {"command": "RESUMED", "match": self.match_id, "last_seq": self.last_applied}
@@ -1,17 +1,24 @@
 import arcade
 # Import from the new constants file
-from constants import SCREEN_HEIGHT, SCREEN_WIDTH, SQUARE_SIZE, createShip, on_draw, letters
+from constants import SCREEN_HEIGHT, SCREEN_WIDTH, SQUARE_SIZE, createShip, part_angle, on_draw, TextGroup, ship_sprites
+from engine import Placement
+
+# Ship lengths and the y position each one waits at beside the grid before being dragged
+START_POSITIONS = ((5, 20), (4, 100), (3, 180), (3, 260), (2, 340))
+START_X = 20
+
 
 class SetupView(arcade.View):
-    """Handles drag-and-drop ship placement for a single player during setup phase."""
-    def __init__(self, player_number, game_window, player_board):
+    """Handles drag-and-drop ship placement for a single player during setup phase.
+
+    One instance lives for each player; ``reset`` parks its ships beside the
+    grid again for a new game instead of building new sprites.
+    """
+    def __init__(self, player_number, game):
         super().__init__()
-        self.window = game_window
+        self.game = game  # Mode controller (HotseatGame or InternetGame)
         self.player_number = player_number
-        self.player_board = player_board
-        arcade.set_background_color(arcade.color.WHITE)
-
-        print(f"Starting Setup for Player {self.player_number}")
+        self.player_board = None
 
         # Calculate offsets to center the 10x10 grid on screen
         self.grid_x_offset = (SCREEN_WIDTH - SQUARE_SIZE * 10) / 2
@@ -19,11 +26,9 @@ class SetupView(arcade.View):
         
         # --- Create Ships at initial off-grid positions ---
         # Positions are placeholders; ships are draggable
-        self.carrier = createShip(5, 20, 20)
-        self.battleship = createShip(4, 20, 100)
-        self.submarine = createShip(3, 20, 180)
-        self.cruiser = createShip(3, 20, 260)
-        self.destroyer = createShip(2, 20, 340)
+        self.carrier, self.battleship, self.submarine, self.cruiser, self.destroyer = (
+            createShip(length, START_X, y) for length, y in START_POSITIONS
+        )
 
         # Store all ships as list for easy processing
         self.player_ships = [self.carrier, self.battleship, self.submarine, self.cruiser, self.destroyer]
@@ -41,6 +46,28 @@ class SetupView(arcade.View):
         self.drag_offset_x = 0
         self.drag_offset_y = 0
 
+        # Cached instruction text, only re-laid-out if its content changes
+        self.texts = TextGroup()
+
+    def reset(self, player_board):
+        """Start a fresh placement on `player_board`, moving every ship back beside the grid."""
+        self.player_board = player_board
+        self.selected_ship = None
+        self.horizontal = True
+        for ship, (length, y) in zip(self.player_ships, START_POSITIONS):
+            for i, part in enumerate(ship):
+                part.center_x = START_X + i * SQUARE_SIZE + SQUARE_SIZE / 2
+                part.center_y = y + SQUARE_SIZE / 2
+                part.angle = part_angle(i, length, True)
+        print(f"Starting Setup for Player {self.player_number}")
+
+    def discard(self):
+        """Return the draggable ship sprites to the shared pool when the view is dropped."""
+        ship_sprites.release(self.all_sprites)
+
+    def on_show_view(self):
+        arcade.set_background_color(arcade.color.WHITE)
+
     def on_draw(self):
         """Render the grid, ships, and on-screen instructions."""
         self.clear()
@@ -49,11 +76,13 @@ class SetupView(arcade.View):
 
         # Draw instructions with color indicating active player
         color = arcade.color.BLUE if self.player_number == 1 else arcade.color.RED
-        arcade.draw_text(
+        self.texts.set(
+            "instructions",
             f"Player {self.player_number} Setup: Place your ships. "
             f"Press [Space] to rotate. Press [N] to finish.", 
             SCREEN_WIDTH / 2, 10, color, 16, anchor_x="center"
         )
+        self.texts.draw()
 
     def on_mouse_press(self, x, y, button, modifiers):
         """Select the ship part under the mouse to enable dragging."""
@@ -166,11 +195,11 @@ class SetupView(arcade.View):
             # Check if ship placement is valid: all within grid and no overlaps
             value = self.all_ships_placed_correctly()
             if value == 2:
-                # Get ship placement data and updated board marking ships
-                ship_data, board = self.get_ship_placement_data()
+                # Get the canonical fleet placement and the board with the fleet on it
+                fleet, board = self.get_ship_placement_data()
                 
-                # Inform game window that setup finished for this player
-                self.window.on_setup_finished(self.player_number, ship_data, board)
+                # Inform the game that setup finished for this player
+                self.game.on_setup_finished(self.player_number, fleet, board)
             elif value == 1:
                 print("Error: You can't have any overlapping ships")
             else:
@@ -211,31 +240,22 @@ class SetupView(arcade.View):
 
     def get_ship_placement_data(self):
         """
-        Collect placement data for all ships and update player's board to mark ship positions.
+        Describe the placed fleet canonically and place it on the player's board.
 
         Returns:
-            data (list): Nested list with ship parts as [[(x, y, angle), hit_flag], ...].
-            board (dict): Updated player board with ship parts marked as 1.
+            fleet (list): One engine Placement (origin cell, horizontal, length) per ship.
+            board (Board): Player board with the fleet placed on it.
         """
-        data = []
+        fleet = []
         board = self.player_board
 
         for ship in self.player_ships:
-            ship_parts_data = []
-            for part in ship:
-                # Store part position and default hit_flag=0 (unhit)
-                ship_parts_data.append([(part.center_x, part.center_y, part.angle), 0])
-                
-                # Convert center_x/y coordinates to board key like 'A1'
-                col = int((part.center_x - self.grid_x_offset) // SQUARE_SIZE)
-                row = int((part.center_y - self.grid_y_offset) // SQUARE_SIZE)
-                
-                # Verify within grid bounds before updating board state
-                if 0 <= col < 10 and 0 <= row < 10:
-                    key = letters[row] + str(col + 1)
-                    if key in board:
-                        board[key] = 1  # Mark this cell as containing ship
-                
-            data.append(ship_parts_data)
-        
-        return data, board
\ No newline at end of file
+            # The first part is the ship's origin; the second shows which way it extends
+            anchor = ship[0]
+            col = int((anchor.center_x - self.grid_x_offset) // SQUARE_SIZE)
+            row = int((anchor.center_y - self.grid_y_offset) // SQUARE_SIZE)
+            horizontal = len(ship) == 1 or ship[1].center_y == anchor.center_y
+            fleet.append(Placement(row * 10 + col, horizontal, len(ship)))
+
+        board.place_fleet(fleet)
+        return fleet, board
@@ -0,0 +1,218 @@
+# simulator.py
+"""Batched headless simulator: plays many games at once as stacked NumPy arrays.
+
+Each batch holds N games; every array has the game as its first axis and the
+player (0 for player 1, 1 for player 2) as its second:
+
+    ship_at    (N, 2, 100) int8  ship index on each cell of a player's board, -1 for water
+    shot_at    (N, 2, 100) bool  cells of a player's board that have been fired at
+    remaining  (N, 2, 5)   int8  unhit parts left per ship
+    cells_left (N, 2)      int16 unhit ship cells left per board
+    order      (N, 2, 100) int8  the cells each player fires at, in order
+
+One step fires one shot in every unfinished game, with the same rules as
+``HotseatGame.request_attack`` and ``engine.Game.fire``: the shot hits or
+misses, sinks a ship when its last part is hit, ends the game when the
+defender's last ship cell is hit, and otherwise passes the turn. A game takes
+at most 199 steps, so a batch finishes in a couple of hundred vectorised
+steps whatever its size.
+
+Shot orders are fixed per game, so only strategies that do not react to hits
+can be batched: see SHOT_POLICIES. Adaptive strategies (ai.py) are played one
+game at a time by the tournament runner instead.
+
+Nothing here imports arcade; NumPy is needed for this tool only, not by the
+game. Results are printed as JSON.
+
+Usage:
+    python simulator.py [--games 1000000] [--batch 50000] [--p1 random] [--p2 random] [--seed 1]
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+
+from engine import CELL_COUNT, FLEET_LENGTHS, GRID_SIZE, Placement, placement_cells
+
+# Ship length -> (cell masks (P, 100) bool, placements) for every position on an empty grid
+PLACEMENT_TABLES = {}
+for _length in sorted(set(FLEET_LENGTHS)):
+    _placements = []
+    for _cell in range(CELL_COUNT):
+        for _horizontal in (True, False):
+            try:
+                placement_cells(Placement(_cell, _horizontal, _length))
+            except ValueError:
+                continue
+            _placements.append(Placement(_cell, _horizontal, _length))
+    _masks = np.zeros((len(_placements), CELL_COUNT), dtype=bool)
+    for _i, _placement in enumerate(_placements):
+        _masks[_i, placement_cells(_placement)] = True
+    PLACEMENT_TABLES[_length] = (_masks, _placements)
+
+_ROWS, _COLS = np.divmod(np.arange(CELL_COUNT), GRID_SIZE)
+# Checkerboard colour of each cell; every ship covers at least one 0 cell
+PARITY = ((_ROWS + _COLS) % 2).astype(np.float64)
+
+
+def random_orders(rng, shape):
+    """Uniformly random firing order over all cells."""
+    return np.argsort(rng.random(shape + (CELL_COUNT,)), axis=-1).astype(np.int8)
+
+
+def parity_orders(rng, shape):
+    """Random order over one checkerboard colour first, then the other."""
+    return np.argsort(rng.random(shape + (CELL_COUNT,)) + PARITY, axis=-1).astype(np.int8)
+
+
+def sweep_orders(rng, shape):
+    """Row-by-row sweep from A1, the load test's scripted policy."""
+    return np.broadcast_to(np.arange(CELL_COUNT, dtype=np.int8), shape + (CELL_COUNT,)).copy()
+
+
+# Shot policy name -> function(rng, shape) returning firing orders of shape `shape + (100,)`
+SHOT_POLICIES = {"random": random_orders, "parity": parity_orders, "sweep": sweep_orders}
+
+
+def random_fleets(rng, games, lengths=FLEET_LENGTHS):
+    """Place a uniformly random legal fleet on both boards of `games` games.
+
+    Ships are placed in order; games whose new ship overlaps an earlier one
+    redraw just that ship until every game has a legal position for it.
+
+    Returns:
+        tuple: (ship_at (games, 2, 100) int8, choice (games, 2, ships) int index
+        into each length's placement table)
+    """
+    ship_at = np.full((games, 2, CELL_COUNT), -1, dtype=np.int8)
+    choice = np.zeros((games, 2, len(lengths)), dtype=np.int32)
+    flat_ships = ship_at.reshape(games * 2, CELL_COUNT)
+    flat_choice = choice.reshape(games * 2, len(lengths))
+    for ship, length in enumerate(lengths):
+        masks, _ = PLACEMENT_TABLES[length]
+        pending = np.arange(games * 2)
+        while pending.size:
+            picks = rng.integers(len(masks), size=pending.size)
+            cells = masks[picks]
+            clash = (cells & (flat_ships[pending] >= 0)).any(axis=1)
+            placed = pending[~clash]
+            flat_choice[placed, ship] = picks[~clash]
+            rows, cols = np.nonzero(cells[~clash])
+            flat_ships[placed[rows], cols] = ship
+            pending = pending[clash]
+    return ship_at, choice
+
+
+def fleet_of(choice, game, player, lengths=FLEET_LENGTHS):
+    """Return the engine Placement list for one board of a batch (for replays and debugging)."""
+    return [PLACEMENT_TABLES[length][1][choice[game, player, ship]] for ship, length in enumerate(lengths)]
+
+
+def play_batch(ship_at, orders, lengths=FLEET_LENGTHS):
+    """Play every game of a batch to the end.
+
+    Args:
+        ship_at (ndarray): (N, 2, 100) ship index per cell, -1 for water.
+        orders (ndarray): (N, 2, 100) firing order of each player.
+
+    Returns:
+        dict: Per-game arrays: ``winner`` (0 or 1), ``shots`` (N, 2) fired by
+        each player, ``hits`` (N, 2) and ``sunk`` (N, 2) scored by each player.
+    """
+    games, ship_count = ship_at.shape[0], len(lengths)
+    remaining = np.broadcast_to(np.array(lengths, dtype=np.int8), (games, 2, ship_count)).copy()
+    cells_left = np.full((games, 2), sum(lengths), dtype=np.int16)
+    shot_at = np.zeros((games, 2, CELL_COUNT), dtype=bool)
+    winner = np.full(games, -1, dtype=np.int8)
+    shots = np.zeros((games, 2), dtype=np.int16)
+    hits = np.zeros((games, 2), dtype=np.int16)
+    sunk = np.zeros((games, 2), dtype=np.int16)
+
+    # Flat views: a (game, player) pair is one board, numbered game * 2 + player
+    flat_ship_at, flat_orders = ship_at.reshape(-1), orders.reshape(-1)
+    flat_remaining, flat_shot_at = remaining.reshape(-1), shot_at.reshape(-1)
+    flat_cells_left, flat_shots = cells_left.reshape(-1), shots.reshape(-1)
+    flat_hits, flat_sunk = hits.reshape(-1), sunk.reshape(-1)
+
+    # Every shot passes the turn and player 1 always starts, so all unfinished
+    # games share the same attacker on every step
+    active = np.arange(games)
+    attacker = 0
+    while active.size:
+        own = active * 2 + attacker    # Attacker's board: its order and counters
+        other = own ^ 1                # Defender's board
+        target = flat_orders[own * CELL_COUNT + flat_shots[own]]
+        flat_shots[own] += 1
+        cell = other * CELL_COUNT + target
+        flat_shot_at[cell] = True
+
+        ship = flat_ship_at[cell]
+        hit = ship >= 0
+        h_own, h_other = own[hit], other[hit]
+        h_part = h_other * ship_count + ship[hit]
+        flat_remaining[h_part] -= 1
+        flat_cells_left[h_other] -= 1
+        flat_hits[h_own] += 1
+        flat_sunk[h_own] += flat_remaining[h_part] == 0
+
+        # The game ends when the defender's last ship cell is hit; otherwise the turn passes
+        over = flat_cells_left[other] == 0
+        if over.any():
+            winner[active[over]] = attacker
+            active = active[~over]
+        attacker ^= 1
+
+    return {"winner": winner, "shots": shots, "hits": hits, "sunk": sunk}
+
+
+def simulate(games, p1="random", p2="random", seed=1, batch=50_000):
+    """Play `games` games in batches and return the outcome statistics with timing."""
+    rng = np.random.default_rng(seed)
+    winners, winning_shots, accuracy = [], [], []
+    started = time.perf_counter()
+    for start in range(0, games, batch):
+        size = min(batch, games - start)
+        ship_at, _ = random_fleets(rng, size)
+        orders = np.stack([SHOT_POLICIES[p1](rng, (size,)), SHOT_POLICIES[p2](rng, (size,))], axis=1)
+        result = play_batch(ship_at, orders)
+        winners.append(result["winner"])
+        winning_shots.append(result["shots"][np.arange(size), result["winner"]])
+        accuracy.append(result["hits"].sum(axis=1) / result["shots"].sum(axis=1))
+    elapsed = time.perf_counter() - started
+
+    winner = np.concatenate(winners)
+    shots = np.concatenate(winning_shots).astype(np.float64)
+    return {
+        "games": games,
+        "p1_policy": p1,
+        "p2_policy": p2,
+        "duration_s": round(elapsed, 3),
+        "games_per_s": round(games / elapsed, 1),
+        "p1_win_rate": round(float(np.mean(winner == 0)), 4),
+        "winner_shots": {
+            "mean": round(float(shots.mean()), 2),
+            "std": round(float(shots.std()), 2),
+            "p5": float(np.percentile(shots, 5)),
+            "p50": float(np.percentile(shots, 50)),
+            "p95": float(np.percentile(shots, 95)),
+            "min": int(shots.min()),
+            "max": int(shots.max()),
+        },
+        "mean_accuracy": round(float(np.concatenate(accuracy).mean()), 4),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batched headless Battleship simulator")
+    parser.add_argument("--games", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=50_000, help="games held in memory at once")
+    parser.add_argument("--p1", choices=sorted(SHOT_POLICIES), default="random", help="player 1 shot policy")
+    parser.add_argument("--p2", choices=sorted(SHOT_POLICIES), default="random", help="player 2 shot policy")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    print(json.dumps(simulate(args.games, args.p1, args.p2, args.seed, args.batch), indent=2))
+
+
+if __name__ == "__main__":
+    main()
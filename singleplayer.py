@@ -0,0 +1,178 @@
+import random
+import time
+
+import arcade
+from setup import SetupView
+from battle import BattleView
+from hotseat_other_screens import GameOverView
+from singleplayer_other_screens import DifficultyView
+from engine import Game, encode_fleet, random_fleet
+from ai import make_strategy
+from views import ViewManager
+
+# Player numbers: the human always plays 1 and moves first
+HUMAN = 1
+COMPUTER = 2
+
+
+class SingleplayerGame:
+    """Single-player mode controller: a human (player 1) against a computer opponent.
+
+    The flow matches Hotseat mode without the hand-over screens:
+      - The player picks a difficulty, then places their ships
+      - The computer places a random fleet
+      - After each of the player's shots the computer fires straight back,
+        and the player sees their own board with its shot before attacking again
+
+    Args:
+        window (GameWindow): The session's window; views are shown on it.
+    """
+
+    def __init__(self, window):
+        self.window = window
+
+        # Player 1's fleet and the computer's (engine Placement tuples)
+        self.player1_setup_data = None
+        self.player2_setup_data = None
+
+        # Headless rules engine holding both boards, the turn and the winner
+        self.game = Game()
+
+        # Difficulty name and the ai.Strategy picking the computer's shots
+        self.difficulty = None
+        self.strategy = None
+        self.rng = random.Random()
+
+        # One setup and battle view, reused every turn and game
+        self.views = ViewManager()
+
+        self.show_difficulty_screen()
+
+    # -------------------- Game State Accessors --------------------
+    @property
+    def current_player(self):
+        """Player (1 or 2) whose turn it is, as tracked by the engine."""
+        return self.game.current_player
+
+    @current_player.setter
+    def current_player(self, player_number):
+        self.game.current_player = player_number
+
+    @property
+    def player1_board(self):
+        return self.game.boards[HUMAN]
+
+    @property
+    def player2_board(self):
+        return self.game.boards[COMPUTER]
+
+    # -------------------- View Management --------------------
+    def show_difficulty_screen(self):
+        """Display the DifficultyView so the player can choose an opponent."""
+        self.window.show_view(self.views.get(("difficulty",), lambda: DifficultyView(self)))
+
+    def start(self, difficulty):
+        """Begin a game against the computer at `difficulty` ('easy', 'medium' or 'hard')."""
+        self.difficulty = difficulty
+        self.strategy = make_strategy(difficulty, self.rng)
+        print(f"[AI] Difficulty: {difficulty} ({self.strategy.name})")
+        self.show_player_setup(HUMAN)
+
+    def show_player_setup(self, player_number):
+        """Display the SetupView for the human player."""
+        setup_view = self.views.get(("setup", player_number), lambda: SetupView(player_number, self))
+        setup_view.reset(self.player1_board)
+        self.window.show_view(setup_view)
+
+    def show_player_battle(self, player_number):
+        """Display the human player's BattleView, updated for the current turn."""
+        battle_view = self.views.get(("battle", player_number), lambda: BattleView(player_number, self))
+        battle_view.prepare(self.player1_setup_data, self.player1_board, self.player2_board)
+        self.window.show_view(battle_view)
+
+    def show_waiting_screen(self, next_player=None):
+        """Called by BattleView after a shot; the computer has already replied, so show the board."""
+        self.show_player_battle(HUMAN)
+
+    def show_end_screen(self, winning_player):
+        """Display the GameOverView announcing the winner of the game."""
+        gameover_view = GameOverView(self, winning_player)
+        self.window.show_view(gameover_view)
+
+    # -------------------- Setup Completion Callback --------------------
+    def on_setup_finished(self, player_number, fleet, board):
+        """Called when the player finishes placing ships; places the computer's fleet and starts battle.
+
+        Args:
+            player_number (int): Player who completed setup (always 1).
+            fleet (list): Engine Placement (origin cell, horizontal, length) per ship.
+            board (Board): The player's board with the fleet placed.
+        """
+        self.game.boards[HUMAN] = board
+        self.player1_setup_data = fleet
+        self.player2_setup_data = random_fleet(self.rng)
+        self.game.place_fleet(COMPUTER, self.player2_setup_data)
+        print(f"Player {player_number} fleet: {encode_fleet(fleet).hex()}")
+
+        self.current_player = HUMAN
+        self.show_player_battle(HUMAN)
+
+    # -------------------- Attack & Game Logic --------------------
+    def request_attack(self, player_number, key):
+        """Resolve the player's attack at `key`, then let the computer take its turn.
+
+        Args:
+            player_number (int): The attacking player (always 1).
+            key (str): The target board coordinate (e.g., 'A1').
+
+        Returns:
+            str: One of 'hit', 'sunk', 'miss', 'invalid', 'already', or 'gameover' indicating result.
+        """
+        print(f"[TURN] Player {player_number} attacks {key}")
+        shot = self.game.fire(player_number, key)
+        if shot.result in ('invalid', 'already'):
+            print(f"[TURN] Attack on {key} ignored: {shot.result}")
+            return shot.result
+        print(f"[TURN] {shot.result.upper()} on {key}")
+
+        if self.game.is_over():
+            print(f"[TURN] GAME OVER! Player {player_number} wins!")
+            self.show_end_screen(player_number)
+            return 'gameover'
+
+        self.computer_turn()
+        if self.game.is_over():
+            return 'gameover'
+        return shot.result
+
+    def computer_turn(self):
+        """Let the strategy pick a target and fire it at the player's board."""
+        started = time.perf_counter()
+        key = self.strategy.choose()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        shot = self.game.fire(COMPUTER, key)
+        self.strategy.record(key, shot.result, shot.sunk_keys)
+        print(f"[AI] {self.difficulty} fires at {key}: {shot.result.upper()} ({elapsed_ms:.2f} ms)")
+
+        if self.game.is_over():
+            print(f"[TURN] GAME OVER! Player {COMPUTER} (computer) wins!")
+            self.show_end_screen(COMPUTER)
+
+    def reset_game_state(self):
+        """Start a new game against the computer at the same difficulty."""
+        self.player1_setup_data = None
+        self.player2_setup_data = None
+        self.game = Game()
+        self.start(self.difficulty)
+
+    def close(self):
+        """Release the cached views' pooled sprites; called when leaving single-player mode."""
+        self.views.clear()
+
+
+if __name__ == '__main__':
+    # Open the game window straight into single-player mode and enter the arcade run loop
+    from window import GameWindow
+    GameWindow().start_mode("singleplayer")
+    arcade.run()
@@ -0,0 +1,54 @@
+import arcade, arcade.gui
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, TextGroup
+
+# Difficulty buttons in menu order: (label, difficulty passed to the controller)
+DIFFICULTY_BUTTONS = (("Easy", "easy"), ("Medium", "medium"), ("Hard", "hard"))
+
+
+class DifficultyView(arcade.View):
+    """Lets the player pick how strong the computer opponent is before setup starts."""
+    # Static screen: the window may drop to its idle frame rate
+    idle_ok = True
+
+    def __init__(self, game):
+        super().__init__()
+        self.game = game  # SingleplayerGame controller
+
+        self.manager = arcade.gui.UIManager()
+
+        # One button per difficulty, stacked vertically
+        grid = arcade.gui.UIGridLayout(
+            column_count=1, row_count=len(DIFFICULTY_BUTTONS), vertical_spacing=20
+        )
+        for row, (label, difficulty) in enumerate(DIFFICULTY_BUTTONS):
+            button = arcade.gui.UIFlatButton(text=label, width=200)
+            button.on_click = lambda e, difficulty=difficulty: self.game.start(difficulty)
+            grid.add(button, column=0, row=row)
+
+        # Center the grid on the screen using an anchor layout
+        anchor = arcade.gui.UIAnchorLayout()
+        anchor.add(child=grid, anchor_x="center_x", anchor_y="center_y")
+        self.manager.add(anchor)
+
+        # Cached text objects drawn as one batch
+        self.texts = TextGroup()
+
+    def on_show_view(self):
+        arcade.set_background_color(arcade.color.DARK_BLUE_GRAY)
+        self.manager.enable()
+
+    def on_hide_view(self):
+        self.manager.disable()
+
+    def on_draw(self):
+        self.clear()
+        self.texts.set(
+            "title", "Choose the computer's difficulty",
+            SCREEN_WIDTH / 2, SCREEN_HEIGHT - 100, arcade.color.WHITE, 24, anchor_x="center"
+        )
+        self.texts.draw()
+        self.manager.draw()
+
+    def on_key_press(self, key, modifiers):
+        if key == arcade.key.ESCAPE:
+            self.window.show_menu()
@@ -0,0 +1,245 @@
+# tournament.py
+"""Round-robin self-play tournament between computer players.
+
+A competitor is a targeting strategy (ai.STRATEGIES) paired with a fleet
+placement policy (ai.PLACEMENT_POLICIES), named like "density/spread". Every
+pair of competitors plays --games games; who fires first alternates from game
+to game. Games are split into chunks and spread over a ProcessPoolExecutor.
+Each game is seeded from (--seed, the two competitors, the game number), so a
+game plays out the same way on any worker, in any order and on every run.
+
+Ratings are Elo-style: a Bradley-Terry fit of all results, scaled so a
+400-point gap means 10:1 odds and the field averages 1500. Unlike running Elo
+updates, the fit does not depend on the order games finish in. Each
+competitor also gets its mean shots-to-win (shots fired in games it won) with
+a 95% confidence interval.
+
+Finished chunks are written to a checkpoint file as they arrive. Running the
+same command again skips them, so an interrupted run picks up where it
+stopped. Results are printed as JSON.
+
+Usage:
+    python tournament.py [--strategies random,hunt_target,density] [--placements random,edges,spread]
+                         [--games 100] [--workers N] [--chunk 20] [--seed 1]
+                         [--checkpoint tournament_checkpoint.json]
+"""
+import argparse
+import concurrent.futures
+import itertools
+import json
+import math
+import os
+import random
+import statistics
+import time
+
+import ai
+from engine import Game
+
+CHECKPOINT_INTERVAL = 5.0  # Seconds between checkpoint writes while chunks keep finishing
+RATING_ITERATIONS = 200
+PRIOR_GAMES = 1  # Virtual drawn games per pairing, so an unbeaten competitor still gets a finite rating
+
+
+def play_game(first, second, rng):
+    """Play one game between two competitors; `first` fires first.
+
+    Args:
+        first, second (tuple): (strategy name, placement policy name).
+        rng (random.Random): The game's source of randomness.
+
+    Returns:
+        tuple: (winner, shots) with winner 0 for `first` and 1 for `second`,
+        and the number of shots the winner fired.
+    """
+    game = Game()
+    shooters = {}
+    for player, (strategy, placement) in ((1, first), (2, second)):
+        game.place_fleet(player, ai.PLACEMENT_POLICIES[placement](rng))
+        shooters[player] = ai.make_strategy(strategy, rng)
+    while not game.is_over():
+        player = game.current_player
+        key = shooters[player].choose()
+        shot = game.fire(player, key)
+        shooters[player].record(key, shot.result, shot.sunk_keys)
+    return game.winner - 1, game.stats(game.winner)['shots']
+
+
+def run_chunk(seed, a, b, start, count):
+    """Process-pool entry point: games start..start+count-1 of the pairing a vs b.
+
+    Returns:
+        list: One [winner, shots] per game, winner 0 for `a` and 1 for `b`.
+    """
+    results = []
+    for number in range(start, start + count):
+        rng = random.Random(f"{seed}:{a}:{b}:{number}")
+        a_first = number % 2 == 0
+        first, second = (a, b) if a_first else (b, a)
+        winner, shots = play_game(tuple(first.split("/")), tuple(second.split("/")), rng)
+        results.append([winner if a_first else 1 - winner, shots])
+    return results
+
+
+def elo_ratings(names, wins):
+    """Fit Bradley-Terry strengths to the win counts and return them on an Elo scale.
+
+    Args:
+        names (list): Competitor names.
+        wins (dict): (winner, loser) -> games won.
+    """
+    games = {(i, j): wins.get((i, j), 0) + wins.get((j, i), 0) + 2 * PRIOR_GAMES * (i != j)
+             for i in names for j in names}
+    won = {i: sum(wins.get((i, j), 0) + PRIOR_GAMES for j in names if j != i) for i in names}
+    strength = dict.fromkeys(names, 1.0)
+    for _ in range(RATING_ITERATIONS):
+        strength = {
+            i: won[i] / sum(games[i, j] / (strength[i] + strength[j]) for j in names if j != i)
+            for i in names
+        }
+        scale = math.exp(statistics.fmean(math.log(s) for s in strength.values()))
+        strength = {i: s / scale for i, s in strength.items()}
+    return {i: 1500 + 400 * math.log10(strength[i]) for i in names}
+
+
+def summarize(names, pairings, chunks, games, chunk_size):
+    """Turn the finished chunks into win counts, ratings and shots-to-win per competitor."""
+    wins = {}
+    shots = {name: [] for name in names}
+    played = dict.fromkeys(names, 0)
+    for index, (a, b) in enumerate(pairings):
+        for start in range(0, games, chunk_size):
+            results = chunks.get(f"{index}:{start}", ())
+            for winner, count in results:
+                won, lost = (a, b) if winner == 0 else (b, a)
+                wins[won, lost] = wins.get((won, lost), 0) + 1
+                shots[won].append(count)
+                played[a] += 1
+                played[b] += 1
+
+    ratings = elo_ratings(names, wins)
+    table = []
+    for name in names:
+        won = len(shots[name])
+        entry = {"competitor": name, "elo": round(ratings[name], 1), "games": played[name], "wins": won,
+                 "win_rate": round(won / played[name], 4) if played[name] else None}
+        if won:
+            mean = statistics.fmean(shots[name])
+            half = 1.96 * statistics.stdev(shots[name]) / math.sqrt(won) if won > 1 else float("nan")
+            entry["mean_shots_to_win"] = round(mean, 2)
+            entry["shots_ci95"] = [round(mean - half, 2), round(mean + half, 2)]
+        table.append(entry)
+    table.sort(key=lambda entry: entry["elo"], reverse=True)
+    return table
+
+
+def load_checkpoint(path, config):
+    """Return the finished chunks stored at `path`, or {} if there is no checkpoint yet.
+
+    Raises:
+        ValueError: If the checkpoint belongs to a tournament with different settings.
+    """
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        data = json.load(f)
+    if data.get("config") != config:
+        raise ValueError(f"{path} was written for a different tournament; remove it or pass another --checkpoint")
+    return data["chunks"]
+
+
+def save_checkpoint(path, config, chunks):
+    """Write the checkpoint atomically, so an interrupted write never loses earlier results."""
+    if not path:
+        return
+    temp = path + ".tmp"
+    with open(temp, "w") as f:
+        json.dump({"config": config, "chunks": chunks}, f)
+    os.replace(temp, path)
+
+
+def tournament_config(args):
+    """Return the settings that identify a tournament (and must match to resume it)."""
+    names = [f"{strategy}/{placement}" for strategy in args.strategies for placement in args.placements]
+    return {"competitors": names, "games": args.games, "chunk": args.chunk, "seed": args.seed}
+
+
+def run_tournament(args, config, chunks):
+    """Play every chunk missing from `chunks` and return the report."""
+    names = config["competitors"]
+    pairings = list(itertools.combinations(names, 2))
+    resumed = sum(len(results) for results in chunks.values())
+
+    todo = [(index, a, b, start, min(args.chunk, args.games - start))
+            for index, (a, b) in enumerate(pairings)
+            for start in range(0, args.games, args.chunk)
+            if f"{index}:{start}" not in chunks]
+
+    started = time.perf_counter()
+    played = 0
+    with concurrent.futures.ProcessPoolExecutor(args.workers) as pool:
+        futures = {pool.submit(run_chunk, args.seed, a, b, start, count): f"{index}:{start}"
+                   for index, a, b, start, count in todo}
+        last_save = time.monotonic()
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                chunks[futures[future]] = future.result()
+                played += len(chunks[futures[future]])
+                if time.monotonic() - last_save >= CHECKPOINT_INTERVAL:
+                    save_checkpoint(args.checkpoint, config, chunks)
+                    last_save = time.monotonic()
+        finally:
+            # Keep whatever finished, also when interrupted
+            for future in futures:
+                future.cancel()
+            save_checkpoint(args.checkpoint, config, chunks)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "competitors": len(names),
+        "games_per_pairing": args.games,
+        "games": sum(len(results) for results in chunks.values()),
+        "resumed_games": resumed,
+        "workers": args.workers,
+        "duration_s": round(elapsed, 3),
+        "games_per_s": round(played / elapsed, 1) if elapsed else None,
+        "ratings": summarize(names, pairings, chunks, args.games, args.chunk),
+    }
+
+
+def names_list(choices):
+    """argparse type: a comma-separated list whose items must all be in `choices`."""
+    def parse(text):
+        items = [item for item in text.split(",") if item]
+        unknown = [item for item in items if item not in choices]
+        if unknown or not items:
+            raise argparse.ArgumentTypeError(f"choose from {', '.join(choices)}")
+        return items
+    return parse
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Battleship self-play tournament")
+    parser.add_argument("--strategies", type=names_list(list(ai.STRATEGIES)), default=list(ai.STRATEGIES))
+    parser.add_argument("--placements", type=names_list(list(ai.PLACEMENT_POLICIES)),
+                        default=list(ai.PLACEMENT_POLICIES))
+    parser.add_argument("--games", type=int, default=100, help="games per pairing of competitors")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--chunk", type=int, default=20, help="games per work unit (and checkpoint step)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--checkpoint", default="tournament_checkpoint.json",
+                        help="file recording finished chunks ('' to disable)")
+    args = parser.parse_args()
+    if len(args.strategies) * len(args.placements) < 2:
+        parser.error("a tournament needs at least two competitors")
+    config = tournament_config(args)
+    try:
+        chunks = load_checkpoint(args.checkpoint, config)
+    except ValueError as e:
+        parser.error(str(e))
+    report = run_tournament(args, config, chunks)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,353 @@
+"""asyncio networking core for network games.
+
+A single asyncio event loop runs in a background thread alongside the arcade
+loop. Connecting, accepting, reading and writing all happen on it with
+timeouts and cancellation, so nothing ever blocks rendering, and one loop can
+drive any number of connections (the game window uses one, a server many).
+
+Callbacks (``on_message``, ``on_close``, ``on_connection``) run on the network
+thread; UI code must hand their work over to the main thread.
+
+Connections exchange PING/PONG heartbeats on the loop itself, keep a smoothed
+round-trip time, and close with a TimeoutError once the peer has been silent
+for longer than the heartbeat timeout (e.g. a half-open TCP connection).
+"""
+import asyncio
+import collections
+import socket
+import threading
+import time
+
+import protocol
+
+CONNECT_TIMEOUT = 5.0  # Seconds before an unreachable host is given up on
+DISPATCH_BUDGET = 32   # Most queued callbacks the main thread runs per frame
+HEARTBEAT_INTERVAL = 1.0  # Seconds between PINGs
+HEARTBEAT_TIMEOUT = 5.0   # Seconds without any data from the peer before it is declared dead
+RTT_ALPHA = 0.125         # Weight of each new sample in the smoothed RTT (as TCP's SRTT)
+
+
+class NetworkLoop:
+    """Background thread running one asyncio event loop."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run, name="network-loop", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro):
+        """Run a coroutine on the loop from any thread; returns a concurrent.futures.Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def call_soon(self, callback, *args):
+        """Run a plain callback on the loop from any thread."""
+        self.loop.call_soon_threadsafe(callback, *args)
+
+
+_network_loop = None
+_network_loop_lock = threading.Lock()
+
+
+def get_network_loop():
+    """Return the process-wide NetworkLoop, starting it on first use."""
+    global _network_loop
+    with _network_loop_lock:
+        if _network_loop is None:
+            _network_loop = NetworkLoop()
+        return _network_loop
+
+
+class Connection:
+    """One framed TCP connection driven by the asyncio loop.
+
+    Incoming bytes go straight into a protocol.FrameReader via ``sock_recv_into``
+    and every decoded message is passed to ``on_message``. Frames handed to
+    ``send`` (from any thread) are written in order by a writer task, which
+    joins everything queued since its last write into a single send. Nagle's
+    algorithm is disabled so small turn messages leave immediately.
+
+    PING/PONG heartbeats are answered here and never reach ``on_message``;
+    ``rtt`` holds the smoothed round-trip time in seconds (None until the
+    first PONG).
+
+    Args:
+        sock (socket.socket): A connected socket; it is switched to non-blocking.
+        on_message (callable): Called with each decoded message.
+        on_close (callable): Called once when the connection ends, with the
+            exception that ended it (or None for a clean close).
+        heartbeat_interval (float or None): Seconds between PINGs; None disables heartbeats.
+        heartbeat_timeout (float): Seconds of silence before the peer is declared dead.
+    """
+
+    def __init__(self, sock, on_message, on_close=None, net=None,
+                 heartbeat_interval=HEARTBEAT_INTERVAL, heartbeat_timeout=HEARTBEAT_TIMEOUT):
+        self.net = net or get_network_loop()
+        self.sock = sock
+        self.sock.setblocking(False)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.on_message = on_message
+        self.on_close = on_close
+        self.peer = sock.getpeername()
+        self.reader = protocol.FrameReader()
+        self.closed = False
+        self.heartbeat_interval = heartbeat_interval
+        self.heartbeat_timeout = heartbeat_timeout
+        self.rtt = None
+        self.last_received = None
+        self._outbox = None
+        self._tasks = []
+        # Tasks must be created on the loop's own thread
+        self.net.call_soon(self._start)
+
+    def _start(self):
+        loop = self.net.loop
+        self._outbox = asyncio.Queue()
+        self.last_received = loop.time()
+        self._tasks = [loop.create_task(self._read_loop()), loop.create_task(self._write_loop())]
+        if self.heartbeat_interval:
+            self._tasks.append(loop.create_task(self._heartbeat_loop()))
+
+    async def _read_loop(self):
+        loop = asyncio.get_running_loop()
+        error = None
+        try:
+            while not self.closed:
+                count = await loop.sock_recv_into(self.sock, self.reader.free_view())
+                if count == 0:
+                    break  # Peer closed the connection
+                self.reader.commit(count)
+                self.last_received = loop.time()  # Any data proves the peer is alive
+                for message in self.reader.messages():
+                    if not self._handle_heartbeat(message, loop):
+                        self.on_message(message)
+                    if self.closed:
+                        break  # Closed or detached by a handler
+        except asyncio.CancelledError:
+            pass
+        except (OSError, protocol.ProtocolError) as e:
+            error = e
+        self._finish(error)
+
+    async def _write_loop(self):
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                frame = await self._outbox.get()
+                if not self._outbox.empty():
+                    # Coalesce whatever else is already waiting into one write
+                    frames = [frame]
+                    while not self._outbox.empty():
+                        frames.append(self._outbox.get_nowait())
+                    frame = b''.join(frames)
+                await loop.sock_sendall(self.sock, frame)
+        except asyncio.CancelledError:
+            pass
+        except OSError as e:
+            self._finish(e)
+
+    async def _heartbeat_loop(self):
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                await asyncio.sleep(self.heartbeat_interval)
+                silence = loop.time() - self.last_received
+                if silence > self.heartbeat_timeout:
+                    self._finish(TimeoutError(f"No data from peer for {silence:.1f}s"))
+                    return
+                self._enqueue(protocol.encode_json({"command": "PING", "sent": loop.time()}))
+        except asyncio.CancelledError:
+            pass
+
+    def _handle_heartbeat(self, message, loop):
+        """Answer PING and time PONG; return True if `message` was a heartbeat."""
+        command = message.get("command") if isinstance(message, dict) else None
+        if command == "PING":
+            self._enqueue(protocol.encode_json({"command": "PONG", "sent": message.get("sent")}))
+            return True
+        if command == "PONG":
+            sample = loop.time() - message.get("sent", 0)
+            self.rtt = sample if self.rtt is None else self.rtt + RTT_ALPHA * (sample - self.rtt)
+            return True
+        return False
+
+    def send(self, frame):
+        """Queue an encoded frame for sending; safe to call from any thread."""
+        if not self.closed:
+            self.net.call_soon(self._enqueue, frame)
+
+    def _enqueue(self, frame):
+        if self._outbox is not None and not self.closed:
+            self._outbox.put_nowait(frame)
+
+    def close(self):
+        """Close the connection from any thread; on_close still fires once."""
+        self.net.call_soon(self._finish, None)
+
+    def detach(self):
+        """Stop serving the socket without closing it and return it; call on the loop thread.
+
+        Used to hand a live client to another process. on_close does not fire.
+        """
+        self.closed = True
+        current = asyncio.current_task()
+        for task in self._tasks:
+            if task is not current:
+                task.cancel()
+        return self.sock
+
+    def _finish(self, error):
+        """Tear down on the loop thread and report the close exactly once."""
+        if self.closed:
+            return
+        self.closed = True
+        current = asyncio.current_task()
+        for task in self._tasks:
+            if task is not current:
+                task.cancel()
+        self.sock.close()
+        if self.on_close:
+            self.on_close(error)
+
+
+def connect(host, port, on_message, on_close=None, timeout=CONNECT_TIMEOUT, net=None, **options):
+    """Open a Connection without blocking the caller.
+
+    Extra keyword arguments (e.g. heartbeat_interval) are passed to Connection.
+
+    Returns:
+        concurrent.futures.Future: Resolves to the Connection, or raises
+        OSError/TimeoutError if the host cannot be reached in time. Cancelling
+        the future abandons the attempt.
+    """
+    net = net or get_network_loop()
+
+    async def _connect():
+        loop = asyncio.get_running_loop()
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setblocking(False)
+        try:
+            await asyncio.wait_for(loop.sock_connect(sock, (host, port)), timeout)
+        except BaseException:
+            sock.close()
+            raise
+        return Connection(sock, on_message, on_close, net, **options)
+
+    return net.submit(_connect())
+
+
+class Listener:
+    """Accepts TCP connections on the network loop and hands each one to a callback.
+
+    Args:
+        host (str): Address to bind.
+        port (int): Port to bind.
+        on_connection (callable): Called on the network thread with each
+            accepted socket; it should wrap it in a Connection (or close it).
+        backlog (int): Listen backlog.
+        reuse_port (bool): Set SO_REUSEPORT so several processes can listen on
+            the same port and the kernel spreads connections between them.
+    """
+
+    def __init__(self, host, port, on_connection, backlog=128, net=None, reuse_port=False):
+        self.net = net or get_network_loop()
+        self.on_connection = on_connection
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if reuse_port:
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        self.sock.bind((host, port))
+        self.sock.listen(backlog)
+        self.sock.setblocking(False)
+        self.address = self.sock.getsockname()
+        self.closed = False
+        self.future = self.net.submit(self._accept_loop())
+
+    async def _accept_loop(self):
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                client, address = await loop.sock_accept(self.sock)
+                self.on_connection(client, address)
+        except asyncio.CancelledError:
+            pass
+        except OSError as e:
+            if not self.closed:
+                print(f"Listener error: {e}")
+
+    def close(self):
+        """Stop accepting and close the listening socket."""
+        self.closed = True
+        self.future.cancel()
+        self.net.call_soon(self.sock.close)
+
+
+class MessageDispatcher:
+    """Thread-safe inbound queue that the main thread drains once per frame.
+
+    Network callbacks ``post`` work from any thread; the window calls
+    ``drain`` from on_update, which runs at most ``budget`` queued callbacks so
+    a burst of messages cannot stall a frame. Every callback runs exactly once,
+    in arrival order.
+
+    Metrics (see ``metrics``): current and peak queue depth, callbacks
+    dispatched, and average/peak latency from post to dispatch.
+    """
+
+    def __init__(self, budget=DISPATCH_BUDGET):
+        self.budget = budget
+        self.queue = collections.deque()  # append/popleft are thread-safe
+        self.dispatched = 0
+        self.max_depth = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def post(self, callback, *args):
+        """Queue `callback(*args)` to run on the main thread; safe from any thread."""
+        self.queue.append((time.perf_counter(), callback, args))
+        depth = len(self.queue)
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+    def drain(self):
+        """Run up to `budget` queued callbacks; call once per frame on the main thread.
+
+        Returns:
+            int: Number of callbacks run.
+        """
+        count = 0
+        while count < self.budget:
+            try:
+                posted_at, callback, args = self.queue.popleft()
+            except IndexError:
+                break
+            latency = time.perf_counter() - posted_at
+            self.total_latency += latency
+            if latency > self.max_latency:
+                self.max_latency = latency
+            self.dispatched += 1
+            count += 1
+            callback(*args)
+        return count
+
+    def clear(self):
+        """Drop everything still queued."""
+        self.queue.clear()
+
+    @property
+    def depth(self):
+        return len(self.queue)
+
+    def metrics(self):
+        """Return queue depth and dispatch latency figures as a dict."""
+        average = self.total_latency / self.dispatched if self.dispatched else 0.0
+        return {
+            'depth': len(self.queue),
+            'max_depth': self.max_depth,
+            'dispatched': self.dispatched,
+            'avg_latency_ms': average * 1000,
+            'max_latency_ms': self.max_latency * 1000,
+        }
@@ -0,0 +1,30 @@
+class ViewManager:
+    """Keeps one long-lived view per key, such as ("battle", 1), for a game mode.
+
+    Controllers fetch views with ``get`` and update their state in place
+    before showing them, so a turn change re-shows an existing view instead of
+    building new sprites, sprite lists and text layouts.
+
+    Usage:
+        view = self.views.get(("battle", player), lambda: BattleView(player, self))
+        view.prepare(fleet, own_board, opponent_board)
+        self.window.show_view(view)
+    """
+
+    def __init__(self):
+        self.views = {}
+
+    def get(self, key, create):
+        """Return the view stored under `key`, calling `create()` to build it the first time."""
+        view = self.views.get(key)
+        if view is None:
+            view = self.views[key] = create()
+        return view
+
+    def clear(self):
+        """Drop every view, letting each hand back pooled resources through its ``discard``."""
+        for view in self.views.values():
+            discard = getattr(view, "discard", None)
+            if discard:
+                discard()
+        self.views.clear()
@@ -0,0 +1,107 @@
+import importlib
+import json
+import os
+import time
+
+import arcade
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from idle import IdleWindowMixin
+from mainmenu import MainMenuView
+
+# Menu mode name -> (module, controller class, window caption); modules are imported on first use
+MODES = {
+    "hotseat": ("hotseat", "HotseatGame", "Battleship Hotseat"),
+    "network": ("internet", "InternetGame", "Battleship Internet"),
+    "singleplayer": ("singleplayer", "SingleplayerGame", "Battleship vs Computer"),
+}
+
+# Set to a file path to append every timing report to it as a JSON line
+TIMINGS_ENV = "BATTLESHIP_TIMINGS"
+
+
+class StartupTimings:
+    """Cold-start and mode-switch milestones, reported as JSON once each is on screen.
+
+    Milestones are milliseconds since `process_start`; a mode switch records the
+    time from the menu click to the first frame of the new mode and how much of
+    that went into importing the mode's modules.
+    """
+
+    def __init__(self, process_start):
+        self.process_start = process_start
+        self.marks = {}
+        self.pending = None  # (name, started) of a transition waiting for its first frame
+
+    def mark(self, name, at=None):
+        """Record milestone `name` as the time since process start (now, or at perf_counter `at`)."""
+        at = time.perf_counter() if at is None else at
+        self.marks[name] = round((at - self.process_start) * 1000, 2)
+
+    def begin(self, name):
+        """Start timing a transition that completes on the next drawn frame."""
+        self.pending = (name, time.perf_counter())
+
+    def frame_drawn(self):
+        """Complete the first-frame milestone or a pending transition."""
+        if "first_frame_ms" not in self.marks:
+            self.mark("first_frame_ms")
+            self.report()
+        elif self.pending:
+            name, started = self.pending
+            self.pending = None
+            self.marks[name] = round((time.perf_counter() - started) * 1000, 2)
+            self.report()
+
+    def report(self):
+        line = json.dumps(self.marks)
+        print(f"[STARTUP] {line}")
+        path = os.environ.get(TIMINGS_ENV)
+        if path:
+            with open(path, "a") as f:
+                f.write(line + "\n")
+
+
+class GameWindow(IdleWindowMixin, arcade.Window):
+    """The one window of a session; menus and game modes are views shown in it.
+
+    Choosing a mode imports its module on first use and creates its controller
+    (HotseatGame, InternetGame or SingleplayerGame) as ``self.game``. The controller swaps views
+    on this window, so switching modes never creates a new window or GL context.
+    """
+
+    def __init__(self, process_start=None):
+        super().__init__(SCREEN_WIDTH, SCREEN_HEIGHT, "Battleship - Menu")
+        self.game = None  # Active mode controller, None on the menu
+        self.timings = StartupTimings(process_start or time.perf_counter())
+        self.timings.mark("window_ms")
+
+    def show_menu(self):
+        """Leave the current mode (if any) and return to the main menu."""
+        close = getattr(self.game, "close", None)
+        if close:
+            close()
+        self.game = None
+        self.set_caption("Battleship - Menu")
+        self.show_view(MainMenuView(on_start_game=self.start_mode))
+
+    def start_mode(self, mode):
+        """Start game mode `mode` ("hotseat", "network" or "singleplayer") in this window."""
+        module_name, class_name, caption = MODES[mode]
+        self.timings.begin(f"menu_to_{mode}_ms")
+
+        started = time.perf_counter()
+        module = importlib.import_module(module_name)  # Cached after the first switch
+        self.timings.marks[f"import_{module_name}_ms"] = round((time.perf_counter() - started) * 1000, 2)
+
+        self.set_caption(caption)
+        self.game = getattr(module, class_name)(self)
+
+    def on_update(self, delta_time):
+        update = getattr(self.game, "update", None)
+        if update:
+            update(delta_time)
+        super().on_update(delta_time)
+
+    def on_draw(self):
+        # Runs after the current view has drawn the frame
+        self.timings.frame_drawn()